@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Benchmark terrain generation time against world width (NumPy vs the pure-Python fallback)
+"""
+
+import sys
+import os
+import time
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from jungle_drive import TerrainGenerator, np
+
+WIDTHS = [5000, 50000, 500000, 1000000, 4000000]
+PYTHON_LIMIT = 1000000  # The pure-Python loop gets slow beyond this
+
+
+def best_of(runs, generate):
+    """Return the fastest of several runs in milliseconds"""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        generate()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+print("🏔️ Terrain generation benchmark")
+if np is None:
+    print("numpy is not installed: only the pure-Python generator is timed")
+
+for profile in TerrainGenerator.PROFILES:
+    print(f"\n{profile} profile")
+    print(f"{'width':>10} {'numpy ms':>10} {'python ms':>10} {'MB':>6}")
+    for width in WIDTHS:
+        vectorized = "-"
+        size = width * 4 / (1024 * 1024)  # float32 heights
+        if np is not None:
+            vectorized = f"{best_of(3, lambda: TerrainGenerator.generate(width, profile)):.1f}"
+        python = "-"
+        if width <= PYTHON_LIMIT:
+            params = TerrainGenerator.PROFILES[profile]
+            python = f"{best_of(1, lambda: TerrainGenerator.generate_python(width, params, 0.0, 0.0)):.1f}"
+        print(f"{width:>10} {vectorized:>10} {python:>10} {size:>6.1f}")
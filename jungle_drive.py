@@ -1,10 +1,18 @@
 import pygame
 import random
 import math
+import os
 import sys
+import time
+import argparse
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
 
-# Initialize Pygame
-pygame.init()
+try:
+    import numpy as np
+except ImportError:  # Optional: only the WildlifeHerd backend needs it
+    np = None
 
 # Constants
 SCREEN_WIDTH = 1200
@@ -30,21 +38,259 @@ PAUSED = 2
 GAME_OVER = 3
 REFUEL_MENU = 4
 
+class AssetManager:
+    """Creates cached surfaces in display format and keeps track of every cache built from them"""
+    PIXEL_SCALES = (1, 2)  # Retro pixel mode draws at 1/scale resolution; both divide 1200x800 exactly
+    
+    def __init__(self):
+        self.display = None
+        self.caches = {}  # name -> (size_fn, invalidate_fn)
+        self.conversions = 0
+        self.pixel_scale = 1  # Window pixels per render target pixel
+    
+    def init(self, display):
+        """Attach to the display surface; rebuilds registered caches if the display was replaced"""
+        previous = self.display
+        self.display = display
+        if previous is not None and previous is not display:
+            self.rebuild()
+    
+    @staticmethod
+    def has_display():
+        return pygame.display.get_init() and pygame.display.get_surface() is not None
+    
+    def create(self, size, colorkey=None):
+        """Return a blank opaque surface in display format, optionally keyed for redrawing"""
+        surface = pygame.Surface(size, 0, pygame.display.get_surface()) if self.has_display() else pygame.Surface(size)
+        if colorkey is not None:
+            surface.fill(colorkey)
+            surface.set_colorkey(colorkey)
+        return surface
+    
+    def prepare(self, surface, alpha=False, colorkey=None, scaled=True):
+        """Convert a finished surface to display format; colorkeyed surfaces get RLE acceleration
+        
+        Artwork is drawn at full resolution and shrunk to the render target here (scaled=False
+        for surfaces that were already drawn at the target's size).
+        """
+        if scaled and self.pixel_scale > 1:
+            width, height = surface.get_size()
+            surface = pygame.transform.scale(surface, (max(1, width // self.pixel_scale), max(1, height // self.pixel_scale)))
+        if self.has_display():
+            # Without a display (tests and tools) surfaces are kept as they are
+            surface = surface.convert_alpha() if alpha else surface.convert()
+            self.conversions += 1
+        if colorkey is not None:
+            surface.set_colorkey(colorkey, pygame.RLEACCEL)
+        return surface
+    
+    def set_pixel_scale(self, scale):
+        """Switch the render target resolution; every cache is rebuilt at the new size"""
+        if scale != self.pixel_scale:
+            self.pixel_scale = scale
+            self.rebuild()
+    
+    def scaled(self, value):
+        """Map full-resolution coordinates (a number, point, rect or list of points) to the render target"""
+        scale = self.pixel_scale
+        if scale == 1:
+            return value
+        if isinstance(value, (int, float)):
+            return int(value // scale)
+        if isinstance(value, pygame.Rect):
+            return pygame.Rect(value.x // scale, value.y // scale, value.width // scale, value.height // scale)
+        return type(value)(self.scaled(item) for item in value)
+    
+    def line_width(self, width):
+        """Outline width on the render target (never thinner than one pixel)"""
+        return max(1, width // self.pixel_scale)
+    
+    def register_cache(self, name, size_fn, invalidate_fn):
+        """Track a cache: size_fn returns its bytes, invalidate_fn drops or rebuilds its surfaces"""
+        self.caches[name] = (size_fn, invalidate_fn)
+    
+    def rebuild(self, display=None):
+        """Invalidate every cache after pygame.display.set_mode has been called again"""
+        if display is not None:
+            self.display = display
+        for size_fn, invalidate_fn in self.caches.values():
+            invalidate_fn()
+    
+    def memory_report(self):
+        """Return bytes held by each registered cache plus a total"""
+        report = {name: size_fn() for name, (size_fn, _) in self.caches.items()}
+        report["total"] = sum(report.values())
+        return report
+    
+    @staticmethod
+    def surface_bytes(surface):
+        """Approximate memory used by a surface's pixels"""
+        if surface is None:
+            return 0
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+ASSETS = AssetManager()
+
+class RenderQueue:
+    """Collects world-space sprite blits, culls them against the view once and draws them layer by layer"""
+    # Layers, back to front
+    SCENERY = 0
+    ANIMALS = 1
+    OBSTACLES = 2
+    FINISH = 3
+    JEEP = 4
+    LAYER_COUNT = 5
+    
+    def __init__(self, view_width=SCREEN_WIDTH, view_height=SCREEN_HEIGHT):
+        self.view_width = view_width
+        self.view_height = view_height
+        self.camera_x = 0
+        self.scale = 1  # Render target scale, picked up from ASSETS each frame
+        self.layers = [[] for _ in range(self.LAYER_COUNT)]
+        self.submitted = 0
+        self.culled = 0
+        self.drawn = 0
+    
+    def begin(self, camera_x):
+        """Start a frame viewed from camera_x"""
+        self.camera_x = camera_x
+        self.scale = ASSETS.pixel_scale
+        for layer in self.layers:
+            layer.clear()
+        self.submitted = 0
+        self.culled = 0
+        self.drawn = 0
+    
+    def submit(self, layer, surface, x, y, area=None):
+        """Queue a blit of surface (or its area) with its top-left corner at world position (x, y)"""
+        self.submitted += 1
+        screen_x = x - self.camera_x
+        width, height = (area[2], area[3]) if area is not None else surface.get_size()
+        scale = self.scale
+        if scale > 1:
+            # Positions are full-resolution world units; the surfaces are already at the target's size
+            screen_x, y = screen_x // scale, y // scale
+        if (screen_x + width <= 0 or screen_x >= self.view_width // scale
+                or y + height <= 0 or y >= self.view_height // scale):
+            self.culled += 1
+            return False
+        self.layers[layer].append((surface, (screen_x, y), area))
+        return True
+    
+    def flush(self, screen):
+        """Draw everything queued, back to front, with one blits() call per layer"""
+        for layer in self.layers:
+            if layer:
+                screen.blits(layer, False)
+                self.drawn += len(layer)
+    
+    def stats(self):
+        """Return per-frame counts of submitted, culled and drawn items"""
+        return {"submitted": self.submitted, "culled": self.culled, "drawn": self.drawn}
+
 class RetroFont:
-    """Custom retro font rendering"""
+    """Custom retro font rendering with cached fonts and text surfaces"""
+    # Font registry - each size is loaded only once
+    _fonts = {}
+    # LRU cache of rendered (text, size, color, shadow) surfaces
+    _text_cache = OrderedDict()
+    _cache_bytes = 0
+    cache_budget = 4 * 1024 * 1024  # Bytes of rendered text kept around
+    cache_hits = 0
+    cache_misses = 0
+    
+    @classmethod
+    def get_font(cls, size):
+        """Return the shared font for a size, loading it on first use"""
+        font = cls._fonts.get(size)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(None, size)
+            cls._fonts[size] = font
+        return font
+    
+    @classmethod
+    def get_text_surfaces(cls, text, size=36, color=RETRO_WHITE, shadow=True):
+        """Return cached (text_surface, shadow_surface) for a label; shadow_surface may be None"""
+        key = (text, size, tuple(color), shadow)
+        entry = cls._text_cache.get(key)
+        if entry is not None:
+            cls._text_cache.move_to_end(key)
+            cls.cache_hits += 1
+            return entry
+        
+        cls.cache_misses += 1
+        # Glyphs are rendered straight at the render target's size rather than shrunk
+        font = cls.get_font(max(1, size // ASSETS.pixel_scale))
+        text_surface = ASSETS.prepare(font.render(text, True, color), alpha=True, scaled=False)
+        shadow_surface = ASSETS.prepare(font.render(text, True, RETRO_BLACK), alpha=True, scaled=False) if shadow else None
+        entry = (text_surface, shadow_surface)
+        
+        cls._text_cache[key] = entry
+        cls._cache_bytes += cls.entry_bytes(entry)
+        # Evict least recently used entries once over budget (always keep the newest one)
+        while cls._cache_bytes > cls.cache_budget and len(cls._text_cache) > 1:
+            _, evicted = cls._text_cache.popitem(last=False)
+            cls._cache_bytes -= cls.entry_bytes(evicted)
+        return entry
+    
+    @classmethod
+    def entry_bytes(cls, entry):
+        """Approximate memory used by a cached text entry"""
+        return sum(cls.surface_bytes(surface) for surface in entry if surface is not None)
+    
+    @staticmethod
+    def surface_bytes(surface):
+        """Approximate memory used by a surface's pixels"""
+        return AssetManager.surface_bytes(surface)
+    
+    @classmethod
+    def cache_stats(cls):
+        """Return hit/miss counters and memory use of the text cache"""
+        return {
+            "hits": cls.cache_hits,
+            "misses": cls.cache_misses,
+            "entries": len(cls._text_cache),
+            "bytes": cls._cache_bytes,
+            "budget": cls.cache_budget,
+            "fonts": len(cls._fonts),
+        }
+    
+    @classmethod
+    def clear_cache(cls):
+        """Drop all cached text surfaces and reset the counters"""
+        cls._text_cache.clear()
+        cls._cache_bytes = 0
+        cls.cache_hits = 0
+        cls.cache_misses = 0
+    
     @staticmethod
     def render_retro_text(screen, text, x, y, size=36, color=RETRO_WHITE, shadow=True):
-        font = pygame.font.Font(None, size)
-        if shadow:
-            # Shadow
-            shadow_surface = font.render(text, True, RETRO_BLACK)
-            screen.blit(shadow_surface, (x + 3, y + 3))
-        # Main text
-        text_surface = font.render(text, True, color)
-        screen.blit(text_surface, (x, y))
+        surfaces = RetroFont.get_text_surfaces(text, size, color, shadow)
+        return RetroFont.blit_text(screen, surfaces, x, y)
+    
+    @staticmethod
+    def blit_text(screen, surfaces, x, y):
+        """Blit cached (text, shadow) surfaces at full-resolution position (x, y) on the render target"""
+        text_surface, shadow_surface = surfaces
+        x, y = ASSETS.scaled((x, y))
+        if shadow_surface is not None:
+            # Shadow and main text go out in a single blits() call
+            offset = ASSETS.line_width(3)
+            screen.blits(((shadow_surface, (x + offset, y + offset)), (text_surface, (x, y))), False)
+        else:
+            screen.blit(text_surface, (x, y))
         return text_surface.get_rect(x=x, y=y)
 
 class Jeep:
+    # Pre-rendered sprites keyed by on_ground, shared by all jeeps
+    _sprite_cache = {}
+    _sprite_key = None
+    SPRITE_SIZE = (128, 104)
+    SPRITE_ANCHOR = (64, 64)  # Jeep centre inside the sprite
+    tread_dots = True  # Detail setting: dots around the tyres
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -63,7 +309,18 @@ class Jeep:
         self.facing_right = True
         self.engine_sound_timer = 0
         
+        # Position before the last simulation step and the position to draw at
+        self.prev_x, self.prev_y = x, y
+        self.render_x, self.render_y = x, y
+        
+        # Palette (changing any of these rebuilds the cached sprites)
+        self.body_color = MILITARY_GREEN
+        self.hood_color = (70, 90, 40)
+        self.canvas_color = (100, 120, 60)
+        
     def update(self, keys_pressed, obstacles, terrain_height):
+        self.prev_x, self.prev_y = self.x, self.y
+        
         # Handle horizontal movement
         if keys_pressed[pygame.K_RIGHT]:
             self.velocity_x += self.acceleration
@@ -102,7 +359,7 @@ class Jeep:
         self.y += self.velocity_y
         
         # Keep jeep within world bounds
-        self.x = max(self.width//2, min(5000 - self.width//2, self.x))
+        self.x = max(self.width//2, min(len(terrain_height) - self.width//2, self.x))
         
         # Terrain collision (with safety checks)
         if 0 <= int(self.x) < len(terrain_height):
@@ -123,23 +380,23 @@ class Jeep:
                 self.on_ground = True
         
         # Check collision with obstacles (modified behavior)
+        # Only the obstacles under the jeep's bounding box are looked up in the index
         jeep_rect = pygame.Rect(self.x - self.width//2, self.y - self.height//2, self.width, self.height)
         
-        for obstacle in obstacles:
-            if jeep_rect.colliderect(obstacle.rect):
-                # Check if jeep is on top of obstacle (y position comparison)
-                if self.y < obstacle.y - obstacle.height//4:  # Jeep is above obstacle
-                    # On top of obstacle - reduce fuel 2x instead of health
-                    self.fuel -= 0.2  # 2x normal fuel consumption
-                    # Small bounce effect
-                    if self.velocity_y > 0:
-                        self.velocity_y *= -0.3
-                else:
-                    # Side collision - normal damage and bounce back
-                    self.x, self.y = old_x, old_y
-                    self.velocity_x *= -0.3
-                    self.health -= 8
-                break
+        for obstacle in obstacles.colliding(jeep_rect):
+            # Check if jeep is on top of obstacle (y position comparison)
+            if self.y < obstacle.y - obstacle.height//4:  # Jeep is above obstacle
+                # On top of obstacle - reduce fuel 2x instead of health
+                self.fuel -= 0.2  # 2x normal fuel consumption
+                # Small bounce effect
+                if self.velocity_y > 0:
+                    self.velocity_y *= -0.3
+            else:
+                # Side collision - normal damage and bounce back
+                self.x, self.y = old_x, old_y
+                self.velocity_x *= -0.3
+                self.health -= 8
+            break
         
         # Fuel consumption (slower consumption)
         if abs(self.velocity_x) > 0.1:
@@ -150,16 +407,52 @@ class Jeep:
         # Prevent negative values
         self.health = max(0, self.health)
         self.fuel = max(0, self.fuel)
-    def draw(self, screen, camera_x):
-        # Calculate screen position
-        screen_x = self.x - camera_x
-        screen_y = self.y
-        
+        self.render_x, self.render_y = self.x, self.y
+    
+    def interpolate(self, alpha):
+        """Place the drawn jeep between the last two simulation steps (0 = previous, 1 = current)"""
+        self.render_x = self.prev_x + (self.x - self.prev_x) * alpha
+        self.render_y = self.prev_y + (self.y - self.prev_y) * alpha
+    
+    def get_sprite(self):
+        """Return the cached sprite for the current ground state (the jeep always faces right)"""
+        key = (self.width, self.height, self.body_color, self.hood_color, self.canvas_color, Jeep.tread_dots)
+        if Jeep._sprite_key != key:
+            # Dimensions, palette or detail changed - throw away every variant
+            Jeep._sprite_cache.clear()
+            Jeep._sprite_key = key
+        
+        variant = self.on_ground
+        sprite = Jeep._sprite_cache.get(variant)
+        if sprite is None:
+            sprite = pygame.Surface((Jeep.SPRITE_SIZE[0], Jeep.SPRITE_SIZE[1]), pygame.SRCALPHA)
+            self.render_sprite(sprite, Jeep.SPRITE_ANCHOR[0], Jeep.SPRITE_ANCHOR[1], self.on_ground)
+            sprite = ASSETS.prepare(sprite, alpha=True)
+            Jeep._sprite_cache[variant] = sprite
+        return sprite
+    
+    @classmethod
+    def clear_sprites(cls):
+        """Drop every cached sprite variant"""
+        cls._sprite_cache.clear()
+        cls._sprite_key = None
+    
+    @classmethod
+    def sprite_memory(cls):
+        """Bytes held by the cached sprite variants"""
+        return sum(AssetManager.surface_bytes(sprite) for sprite in cls._sprite_cache.values())
+    
+    def submit(self, queue):
+        queue.submit(RenderQueue.JEEP, self.get_sprite(),
+                     self.render_x - Jeep.SPRITE_ANCHOR[0], self.render_y - Jeep.SPRITE_ANCHOR[1])
+    
+    def render_sprite(self, screen, screen_x, screen_y, on_ground):
+        """Draw the jeep with primitives centred on (screen_x, screen_y)"""
         # Realistic military jeep side view (completely redesigned)
         
         # Main chassis (lower body)
         chassis_rect = pygame.Rect(screen_x - 50, screen_y - 10, 100, 25)
-        pygame.draw.rect(screen, MILITARY_GREEN, chassis_rect)
+        pygame.draw.rect(screen, self.body_color, chassis_rect)
         pygame.draw.rect(screen, RETRO_BLACK, chassis_rect, 3)
         
         # Cabin/passenger area (upper body)
@@ -171,7 +464,7 @@ class Jeep:
             (screen_x + 35, screen_y - 25),  # Front windshield top
             (screen_x + 35, screen_y - 10),  # Front bottom
         ]
-        pygame.draw.polygon(screen, MILITARY_GREEN, cabin_points)
+        pygame.draw.polygon(screen, self.body_color, cabin_points)
         pygame.draw.polygon(screen, RETRO_BLACK, cabin_points, 3)
         
         # Hood (engine compartment)
@@ -182,7 +475,7 @@ class Jeep:
             (screen_x + 55, screen_y - 20),  # Hood front top
             (screen_x + 45, screen_y - 25),  # Hood back top
         ]
-        pygame.draw.polygon(screen, (70, 90, 40), hood_points)
+        pygame.draw.polygon(screen, self.hood_color, hood_points)
         pygame.draw.polygon(screen, RETRO_BLACK, hood_points, 3)
         
         # Windshield (angled glass)
@@ -202,7 +495,7 @@ class Jeep:
             (screen_x + 15, screen_y - 42),
             (screen_x + 25, screen_y - 38)
         ]
-        pygame.draw.polygon(screen, (100, 120, 60), canvas_points)
+        pygame.draw.polygon(screen, self.canvas_color, canvas_points)
         pygame.draw.polygon(screen, RETRO_BLACK, canvas_points, 2)
         
         # Wheels (realistic military tires)
@@ -233,7 +526,7 @@ class Jeep:
                 pygame.draw.line(screen, RETRO_BLACK, (spoke_x1, spoke_y1), (spoke_x2, spoke_y2), 2)
             
             # Tire tread pattern
-            for i in range(8):
+            for i in range(8 if Jeep.tread_dots else 0):
                 angle = i * 45
                 tread_x = wheel_x + 20 * math.cos(math.radians(angle))
                 tread_y = wheel_y + 20 * math.sin(math.radians(angle))
@@ -287,12 +580,14 @@ class Jeep:
         pygame.draw.line(screen, (100, 100, 100), (screen_x - 35, screen_y - 45), (screen_x + 25, screen_y - 45), 4)
         
         # Jump indicator (when in air)
-        if not self.on_ground:
+        if not on_ground:
             pygame.draw.circle(screen, RETRO_YELLOW, 
                              (int(screen_x), int(screen_y - self.height//2 - 25)), 
                              6, 2)
 
 class Animal:
+    animate = True  # Detail setting: flap wings and swing arms
+    
     def __init__(self, x, y, animal_type):
         self.x = x
         self.y = y
@@ -316,7 +611,11 @@ class Animal:
         else:  # monkey
             self.width, self.height = 35, 40
     
-    def update(self):
+    def update(self, ticks=1):
+        """Advance the animal; ticks > 1 catches up several steps at once (used for sleeping animals)"""
+        if ticks > 1:
+            self.catch_up(ticks)
+            return
         self.animation_frame += 0.02  # Very slow, subtle animation
         # Minimal movement for realistic feel - NO LOOPS/ROTATION
         if self.type in ["squirrel", "monkey"]:
@@ -332,224 +631,458 @@ class Animal:
             # Very minimal vertical movement for birds (no loops)
             self.y += math.sin(self.animation_frame * 0.5) * 0.2  # Reduced amplitude
     
-    def draw(self, screen, camera_x):
-        screen_x = self.x - camera_x
-        if -200 < screen_x < SCREEN_WIDTH + 200:  # Only draw if on screen
-            if self.type == "elephant":
-                self.draw_elephant(screen, screen_x)
-            elif self.type == "tiger":
-                self.draw_tiger(screen, screen_x)
-            elif self.type == "deer":
-                self.draw_deer(screen, screen_x)
-            elif self.type == "bear":
-                self.draw_bear(screen, screen_x)
-            elif self.type == "squirrel":
-                self.draw_squirrel(screen, screen_x)
-            elif self.type == "bird":
-                self.draw_bird(screen, screen_x)
-            else:  # monkey
-                self.draw_monkey(screen, screen_x)
-    
-    def draw_elephant(self, screen, screen_x):
+    def catch_up(self, ticks):
+        """Apply ticks single steps in closed form; turning is drawn once with the same overall odds"""
+        start_frame = self.animation_frame
+        self.animation_frame += 0.02 * ticks
+        if self.type in ["squirrel", "monkey"]:
+            turn_chance = 1 / 1001
+        elif self.type == "bird":
+            turn_chance = 1 / 801
+        else:
+            return
+        # Chance of an odd number of turns over the whole span
+        if random.random() < (1 - (1 - 2 * turn_chance) ** ticks) / 2:
+            self.direction *= -1
+        self.x += self.direction * self.speed * 0.1 * ticks
+        if self.type == "bird":
+            # Sum of sin(0.5 * frame) over the skipped frames (arithmetic series of angles)
+            half_step = 0.005
+            self.y += 0.2 * math.sin(ticks * half_step) * math.sin(0.5 * start_frame + (ticks + 1) * half_step) / math.sin(half_step)
+    
+    def get_phase(self):
+        """Return the atlas animation phase for this animal"""
+        if not Animal.animate:
+            return 0
+        if self.type == "monkey":
+            angle = self.animation_frame
+        elif self.type == "bird":
+            angle = self.animation_frame * 4
+        else:
+            return 0
+        return int(angle / (2 * math.pi) * AnimalAtlas.ANIMATION_PHASES) % AnimalAtlas.ANIMATION_PHASES
+    
+    def submit(self, queue):
+        queue.submit(RenderQueue.ANIMALS, AnimalAtlas.surface, self.x - AnimalAtlas.CELL_ANCHOR[0],
+                     self.y - AnimalAtlas.CELL_ANCHOR[1], AnimalAtlas.get_cell(self.type, self.get_phase()))
+    
+    @staticmethod
+    def draw_elephant(screen, screen_x, y):
         # Retro elephant with thick outlines
         # Body
-        pygame.draw.ellipse(screen, (120, 120, 120), (screen_x - 35, self.y - 25, 70, 50))
-        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - 35, self.y - 25, 70, 50), 3)
+        pygame.draw.ellipse(screen, (120, 120, 120), (screen_x - 35, y - 25, 70, 50))
+        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - 35, y - 25, 70, 50), 3)
         # Head
-        pygame.draw.circle(screen, (120, 120, 120), (int(screen_x - 40), int(self.y - 15)), 22)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x - 40), int(self.y - 15)), 22, 3)
+        pygame.draw.circle(screen, (120, 120, 120), (int(screen_x - 40), int(y - 15)), 22)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x - 40), int(y - 15)), 22, 3)
         # Trunk (retro curved)
-        trunk_points = [(screen_x - 55, self.y - 10), (screen_x - 70, self.y), (screen_x - 65, self.y + 15)]
+        trunk_points = [(screen_x - 55, y - 10), (screen_x - 70, y), (screen_x - 65, y + 15)]
         pygame.draw.lines(screen, (120, 120, 120), False, trunk_points, 10)
         pygame.draw.lines(screen, RETRO_BLACK, False, trunk_points, 3)
         # Legs (chunky retro style)
         for leg_x in [screen_x - 25, screen_x - 10, screen_x + 5, screen_x + 20]:
-            pygame.draw.rect(screen, (100, 100, 100), (leg_x - 4, self.y + 20, 8, 18))
-            pygame.draw.rect(screen, RETRO_BLACK, (leg_x - 4, self.y + 20, 8, 18), 2)
+            pygame.draw.rect(screen, (100, 100, 100), (leg_x - 4, y + 20, 8, 18))
+            pygame.draw.rect(screen, RETRO_BLACK, (leg_x - 4, y + 20, 8, 18), 2)
         # Eye (retro style)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x - 45), int(self.y - 20)), 4)
-        pygame.draw.circle(screen, RETRO_WHITE, (int(screen_x - 43), int(self.y - 22)), 2)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x - 45), int(y - 20)), 4)
+        pygame.draw.circle(screen, RETRO_WHITE, (int(screen_x - 43), int(y - 22)), 2)
     
-    def draw_monkey(self, screen, screen_x):
-        # Retro monkey
-        # Body
-        pygame.draw.ellipse(screen, RETRO_BROWN, (screen_x - 15, self.y - 18, 30, 35))
-        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - 15, self.y - 18, 30, 35), 2)
-        # Head
-        pygame.draw.circle(screen, (160, 100, 50), (int(screen_x), int(self.y - 25)), 15)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x), int(self.y - 25)), 15, 2)
-        # Arms (animated)
-        arm_offset = math.sin(self.animation_frame) * 6
-        pygame.draw.line(screen, RETRO_BROWN, (screen_x - 10, self.y - 12), (screen_x - 18, self.y - 8 + arm_offset), 5)
-        pygame.draw.line(screen, RETRO_BROWN, (screen_x + 10, self.y - 12), (screen_x + 18, self.y - 8 - arm_offset), 5)
-        # Legs
-        pygame.draw.line(screen, RETRO_BROWN, (screen_x - 6, self.y + 12), (screen_x - 10, self.y + 25), 5)
-        pygame.draw.line(screen, RETRO_BROWN, (screen_x + 6, self.y + 12), (screen_x + 10, self.y + 25), 5)
-        # Face (retro style)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x - 5), int(self.y - 28)), 3)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 5), int(self.y - 28)), 3)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x), int(self.y - 22)), 2)
-    
-    def draw_tiger(self, screen, screen_x):
+    @staticmethod
+    def draw_tiger(screen, screen_x, y):
         # Retro tiger
         # Body
-        pygame.draw.ellipse(screen, (255, 165, 0), (screen_x - 27, self.y - 18, 55, 35))
-        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - 27, self.y - 18, 55, 35), 3)
+        pygame.draw.ellipse(screen, (255, 165, 0), (screen_x - 27, y - 18, 55, 35))
+        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - 27, y - 18, 55, 35), 3)
         # Head
-        pygame.draw.circle(screen, (255, 165, 0), (int(screen_x + 22), int(self.y - 12)), 18)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 22), int(self.y - 12)), 18, 3)
+        pygame.draw.circle(screen, (255, 165, 0), (int(screen_x + 22), int(y - 12)), 18)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 22), int(y - 12)), 18, 3)
         # Stripes (retro thick)
         for stripe_x in [screen_x - 18, screen_x - 6, screen_x + 6]:
-            pygame.draw.line(screen, RETRO_BLACK, (stripe_x, self.y - 15), (stripe_x, self.y + 10), 4)
+            pygame.draw.line(screen, RETRO_BLACK, (stripe_x, y - 15), (stripe_x, y + 10), 4)
         # Legs (chunky)
         for leg_x in [screen_x - 18, screen_x - 6, screen_x + 6, screen_x + 18]:
-            pygame.draw.rect(screen, (255, 165, 0), (leg_x - 3, self.y + 12, 6, 15))
-            pygame.draw.rect(screen, RETRO_BLACK, (leg_x - 3, self.y + 12, 6, 15), 2)
+            pygame.draw.rect(screen, (255, 165, 0), (leg_x - 3, y + 12, 6, 15))
+            pygame.draw.rect(screen, RETRO_BLACK, (leg_x - 3, y + 12, 6, 15), 2)
         # Ears (retro triangular)
-        pygame.draw.polygon(screen, (255, 165, 0), [(screen_x + 15, self.y - 25), (screen_x + 20, self.y - 30), (screen_x + 25, self.y - 25)])
-        pygame.draw.polygon(screen, (255, 165, 0), [(screen_x + 20, self.y - 25), (screen_x + 25, self.y - 30), (screen_x + 30, self.y - 25)])
+        pygame.draw.polygon(screen, (255, 165, 0), [(screen_x + 15, y - 25), (screen_x + 20, y - 30), (screen_x + 25, y - 25)])
+        pygame.draw.polygon(screen, (255, 165, 0), [(screen_x + 20, y - 25), (screen_x + 25, y - 30), (screen_x + 30, y - 25)])
         # Eyes (retro style)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 18), int(self.y - 15)), 3)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 26), int(self.y - 15)), 3)
-        pygame.draw.circle(screen, RETRO_WHITE, (int(screen_x + 19), int(self.y - 16)), 1)
-        pygame.draw.circle(screen, RETRO_WHITE, (int(screen_x + 27), int(self.y - 16)), 1)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 18), int(y - 15)), 3)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 26), int(y - 15)), 3)
+        pygame.draw.circle(screen, RETRO_WHITE, (int(screen_x + 19), int(y - 16)), 1)
+        pygame.draw.circle(screen, RETRO_WHITE, (int(screen_x + 27), int(y - 16)), 1)
     
-    def draw_bird(self, screen, screen_x):
-        # More realistic bird without red trail
-        # Body (brown/natural color)
-        pygame.draw.ellipse(screen, (139, 69, 19), (screen_x - 12, self.y - 10, 25, 20))
-        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - 12, self.y - 10, 25, 20), 2)
-        # Wing (subtle animation, natural colors)
-        wing_flap = math.sin(self.animation_frame * 4) * 6  # Reduced flap intensity
-        pygame.draw.ellipse(screen, (101, 67, 33), (screen_x - 8, self.y - 12 + wing_flap, 18, 8))
-        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - 8, self.y - 12 + wing_flap, 18, 8), 2)
-        # Head (natural brown)
-        pygame.draw.circle(screen, (160, 82, 45), (int(screen_x + 10), int(self.y - 8)), 8)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 10), int(self.y - 8)), 8, 2)
-        # Beak (orange/yellow)
-        pygame.draw.polygon(screen, (255, 140, 0), [(screen_x + 16, self.y - 8), (screen_x + 22, self.y - 5), (screen_x + 16, self.y - 2)])
-        pygame.draw.polygon(screen, RETRO_BLACK, [(screen_x + 16, self.y - 8), (screen_x + 22, self.y - 5), (screen_x + 16, self.y - 2)], 2)
-        # Eye
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 12), int(self.y - 10)), 2)
-        pygame.draw.circle(screen, RETRO_WHITE, (int(screen_x + 13), int(self.y - 11)), 1)
-    
-    def draw_deer(self, screen, screen_x):
+    @staticmethod
+    def draw_deer(screen, screen_x, y):
         # Retro deer
         # Body
-        pygame.draw.ellipse(screen, RETRO_BROWN, (screen_x - 20, self.y - 18, 40, 30))
-        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - 20, self.y - 18, 40, 30), 3)
+        pygame.draw.ellipse(screen, RETRO_BROWN, (screen_x - 20, y - 18, 40, 30))
+        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - 20, y - 18, 40, 30), 3)
         # Head
-        pygame.draw.circle(screen, (160, 100, 50), (int(screen_x + 18), int(self.y - 18)), 12)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 18), int(self.y - 18)), 12, 2)
+        pygame.draw.circle(screen, (160, 100, 50), (int(screen_x + 18), int(y - 18)), 12)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 18), int(y - 18)), 12, 2)
         # Antlers (retro branched)
-        pygame.draw.line(screen, (80, 50, 20), (screen_x + 15, self.y - 26), (screen_x + 10, self.y - 35), 4)
-        pygame.draw.line(screen, (80, 50, 20), (screen_x + 21, self.y - 26), (screen_x + 26, self.y - 35), 4)
-        pygame.draw.line(screen, (80, 50, 20), (screen_x + 12, self.y - 32), (screen_x + 8, self.y - 38), 3)
-        pygame.draw.line(screen, (80, 50, 20), (screen_x + 24, self.y - 32), (screen_x + 28, self.y - 38), 3)
+        pygame.draw.line(screen, (80, 50, 20), (screen_x + 15, y - 26), (screen_x + 10, y - 35), 4)
+        pygame.draw.line(screen, (80, 50, 20), (screen_x + 21, y - 26), (screen_x + 26, y - 35), 4)
+        pygame.draw.line(screen, (80, 50, 20), (screen_x + 12, y - 32), (screen_x + 8, y - 38), 3)
+        pygame.draw.line(screen, (80, 50, 20), (screen_x + 24, y - 32), (screen_x + 28, y - 38), 3)
         # Legs (retro style)
         for leg_x in [screen_x - 12, screen_x - 4, screen_x + 4, screen_x + 12]:
-            pygame.draw.rect(screen, RETRO_BROWN, (leg_x - 2, self.y + 8, 4, 18))
-            pygame.draw.rect(screen, RETRO_BLACK, (leg_x - 2, self.y + 8, 4, 18), 1)
+            pygame.draw.rect(screen, RETRO_BROWN, (leg_x - 2, y + 8, 4, 18))
+            pygame.draw.rect(screen, RETRO_BLACK, (leg_x - 2, y + 8, 4, 18), 1)
         # Eye
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 22), int(self.y - 20)), 3)
-        pygame.draw.circle(screen, RETRO_WHITE, (int(screen_x + 23), int(self.y - 21)), 1)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 22), int(y - 20)), 3)
+        pygame.draw.circle(screen, RETRO_WHITE, (int(screen_x + 23), int(y - 21)), 1)
         # Tail (retro white)
-        pygame.draw.circle(screen, RETRO_WHITE, (int(screen_x - 20), int(self.y - 8)), 5)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x - 20), int(self.y - 8)), 5, 2)
+        pygame.draw.circle(screen, RETRO_WHITE, (int(screen_x - 20), int(y - 8)), 5)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x - 20), int(y - 8)), 5, 2)
     
-    def draw_bear(self, screen, screen_x):
+    @staticmethod
+    def draw_bear(screen, screen_x, y):
         # Retro bear
         # Body (chunky and round)
-        pygame.draw.ellipse(screen, (101, 67, 33), (screen_x - 32, self.y - 27, 65, 55))
-        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - 32, self.y - 27, 65, 55), 4)
+        pygame.draw.ellipse(screen, (101, 67, 33), (screen_x - 32, y - 27, 65, 55))
+        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - 32, y - 27, 65, 55), 4)
         # Head
-        pygame.draw.circle(screen, (139, 69, 19), (int(screen_x + 25), int(self.y - 20)), 20)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 25), int(self.y - 20)), 20, 4)
+        pygame.draw.circle(screen, (139, 69, 19), (int(screen_x + 25), int(y - 20)), 20)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 25), int(y - 20)), 20, 4)
         # Ears (round)
-        pygame.draw.circle(screen, (139, 69, 19), (int(screen_x + 15), int(self.y - 35)), 8)
-        pygame.draw.circle(screen, (139, 69, 19), (int(screen_x + 35), int(self.y - 35)), 8)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 15), int(self.y - 35)), 8, 3)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 35), int(self.y - 35)), 8, 3)
+        pygame.draw.circle(screen, (139, 69, 19), (int(screen_x + 15), int(y - 35)), 8)
+        pygame.draw.circle(screen, (139, 69, 19), (int(screen_x + 35), int(y - 35)), 8)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 15), int(y - 35)), 8, 3)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 35), int(y - 35)), 8, 3)
         # Legs (thick)
         for leg_x in [screen_x - 20, screen_x - 5, screen_x + 10, screen_x + 25]:
-            pygame.draw.rect(screen, (101, 67, 33), (leg_x - 5, self.y + 20, 10, 22))
-            pygame.draw.rect(screen, RETRO_BLACK, (leg_x - 5, self.y + 20, 10, 22), 3)
+            pygame.draw.rect(screen, (101, 67, 33), (leg_x - 5, y + 20, 10, 22))
+            pygame.draw.rect(screen, RETRO_BLACK, (leg_x - 5, y + 20, 10, 22), 3)
         # Snout
-        pygame.draw.ellipse(screen, (160, 82, 45), (screen_x + 35, self.y - 15, 15, 10))
-        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x + 35, self.y - 15, 15, 10), 2)
+        pygame.draw.ellipse(screen, (160, 82, 45), (screen_x + 35, y - 15, 15, 10))
+        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x + 35, y - 15, 15, 10), 2)
         # Eyes
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 20), int(self.y - 25)), 3)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 30), int(self.y - 25)), 3)
-        pygame.draw.circle(screen, RETRO_WHITE, (int(screen_x + 21), int(self.y - 26)), 1)
-        pygame.draw.circle(screen, RETRO_WHITE, (int(screen_x + 31), int(self.y - 26)), 1)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 20), int(y - 25)), 3)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 30), int(y - 25)), 3)
+        pygame.draw.circle(screen, RETRO_WHITE, (int(screen_x + 21), int(y - 26)), 1)
+        pygame.draw.circle(screen, RETRO_WHITE, (int(screen_x + 31), int(y - 26)), 1)
         # Nose
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 42), int(self.y - 12)), 2)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 42), int(y - 12)), 2)
     
-    def draw_squirrel(self, screen, screen_x):
+    @staticmethod
+    def draw_squirrel(screen, screen_x, y):
         # Retro squirrel (static tail - no animation loops)
         # Body (small and cute)
-        pygame.draw.ellipse(screen, (160, 82, 45), (screen_x - 12, self.y - 15, 25, 30))
-        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - 12, self.y - 15, 25, 30), 3)
+        pygame.draw.ellipse(screen, (160, 82, 45), (screen_x - 12, y - 15, 25, 30))
+        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - 12, y - 15, 25, 30), 3)
         # Head
-        pygame.draw.circle(screen, (160, 82, 45), (int(screen_x + 10), int(self.y - 18)), 10)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 10), int(self.y - 18)), 10, 3)
+        pygame.draw.circle(screen, (160, 82, 45), (int(screen_x + 10), int(y - 18)), 10)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 10), int(y - 18)), 10, 3)
         # Ears (pointed)
-        pygame.draw.polygon(screen, (160, 82, 45), [(screen_x + 5, self.y - 25), (screen_x + 8, self.y - 30), (screen_x + 11, self.y - 25)])
-        pygame.draw.polygon(screen, (160, 82, 45), [(screen_x + 9, self.y - 25), (screen_x + 12, self.y - 30), (screen_x + 15, self.y - 25)])
-        pygame.draw.polygon(screen, RETRO_BLACK, [(screen_x + 5, self.y - 25), (screen_x + 8, self.y - 30), (screen_x + 11, self.y - 25)], 2)
-        pygame.draw.polygon(screen, RETRO_BLACK, [(screen_x + 9, self.y - 25), (screen_x + 12, self.y - 30), (screen_x + 15, self.y - 25)], 2)
+        pygame.draw.polygon(screen, (160, 82, 45), [(screen_x + 5, y - 25), (screen_x + 8, y - 30), (screen_x + 11, y - 25)])
+        pygame.draw.polygon(screen, (160, 82, 45), [(screen_x + 9, y - 25), (screen_x + 12, y - 30), (screen_x + 15, y - 25)])
+        pygame.draw.polygon(screen, RETRO_BLACK, [(screen_x + 5, y - 25), (screen_x + 8, y - 30), (screen_x + 11, y - 25)], 2)
+        pygame.draw.polygon(screen, RETRO_BLACK, [(screen_x + 9, y - 25), (screen_x + 12, y - 30), (screen_x + 15, y - 25)], 2)
         # Tail (static - no animation)
-        pygame.draw.ellipse(screen, (139, 69, 19), (screen_x - 25, self.y - 25, 20, 35))
-        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - 25, self.y - 25, 20, 35), 3)
+        pygame.draw.ellipse(screen, (139, 69, 19), (screen_x - 25, y - 25, 20, 35))
+        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - 25, y - 25, 20, 35), 3)
         # Eyes
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 8), int(self.y - 20)), 2)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 12), int(self.y - 20)), 2)
-        pygame.draw.circle(screen, RETRO_WHITE, (int(screen_x + 8), int(self.y - 21)), 1)
-        pygame.draw.circle(screen, RETRO_WHITE, (int(screen_x + 12), int(self.y - 21)), 1)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 8), int(y - 20)), 2)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 12), int(y - 20)), 2)
+        pygame.draw.circle(screen, RETRO_WHITE, (int(screen_x + 8), int(y - 21)), 1)
+        pygame.draw.circle(screen, RETRO_WHITE, (int(screen_x + 12), int(y - 21)), 1)
         # Nose
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 15), int(self.y - 16)), 1)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 15), int(y - 16)), 1)
     
-    def draw_monkey(self, screen, screen_x):
-        # Retro monkey (static - no rotating arms)
+    @staticmethod
+    def draw_monkey(screen, screen_x, y, phase=0.0):
+        # Retro monkey (arms swing gently with the animation phase)
         # Body
-        pygame.draw.ellipse(screen, RETRO_BROWN, (screen_x - 17, self.y - 20, 35, 40))
-        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - 17, self.y - 20, 35, 40), 3)
+        pygame.draw.ellipse(screen, RETRO_BROWN, (screen_x - 17, y - 20, 35, 40))
+        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - 17, y - 20, 35, 40), 3)
         # Head
-        pygame.draw.circle(screen, (160, 100, 50), (int(screen_x), int(self.y - 25)), 15)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x), int(self.y - 25)), 15, 3)
-        # Arms (static position - no animation)
-        pygame.draw.line(screen, RETRO_BROWN, (screen_x - 12, self.y - 15), (screen_x - 20, self.y - 10), 6)
-        pygame.draw.line(screen, RETRO_BROWN, (screen_x + 12, self.y - 15), (screen_x + 20, self.y - 10), 6)
+        pygame.draw.circle(screen, (160, 100, 50), (int(screen_x), int(y - 25)), 15)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x), int(y - 25)), 15, 3)
+        # Arms (animated)
+        arm_offset = math.sin(phase) * 6
+        pygame.draw.line(screen, RETRO_BROWN, (screen_x - 12, y - 15), (screen_x - 20, y - 10 + arm_offset), 6)
+        pygame.draw.line(screen, RETRO_BROWN, (screen_x + 12, y - 15), (screen_x + 20, y - 10 - arm_offset), 6)
         # Legs (static)
-        pygame.draw.line(screen, RETRO_BROWN, (screen_x - 8, self.y + 15), (screen_x - 12, self.y + 28), 6)
-        pygame.draw.line(screen, RETRO_BROWN, (screen_x + 8, self.y + 15), (screen_x + 12, self.y + 28), 6)
+        pygame.draw.line(screen, RETRO_BROWN, (screen_x - 8, y + 15), (screen_x - 12, y + 28), 6)
+        pygame.draw.line(screen, RETRO_BROWN, (screen_x + 8, y + 15), (screen_x + 12, y + 28), 6)
         # Face (retro style)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x - 6), int(self.y - 28)), 3)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 6), int(self.y - 28)), 3)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x), int(self.y - 22)), 2)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x - 6), int(y - 28)), 3)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 6), int(y - 28)), 3)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x), int(y - 22)), 2)
         # Tail (static)
-        pygame.draw.line(screen, RETRO_BROWN, (screen_x - 17, self.y), (screen_x - 25, self.y - 8), 5)
+        pygame.draw.line(screen, RETRO_BROWN, (screen_x - 17, y), (screen_x - 25, y - 8), 5)
     
-    def draw_bird(self, screen, screen_x):
-        # Realistic bird without animation loops
+    @staticmethod
+    def draw_bird(screen, screen_x, y, phase=0.0):
+        # Realistic bird (wing moves gently with the animation phase)
         # Body (brown/natural color)
-        pygame.draw.ellipse(screen, (139, 69, 19), (screen_x - 15, self.y - 12, 30, 25))
-        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - 15, self.y - 12, 30, 25), 3)
-        # Wing (static position - no flapping animation)
-        pygame.draw.ellipse(screen, (101, 67, 33), (screen_x - 10, self.y - 15, 22, 10))
-        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - 10, self.y - 15, 22, 10), 2)
+        pygame.draw.ellipse(screen, (139, 69, 19), (screen_x - 15, y - 12, 30, 25))
+        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - 15, y - 12, 30, 25), 3)
+        # Wing (subtle animation, natural colors)
+        wing_flap = math.sin(phase) * 6
+        pygame.draw.ellipse(screen, (101, 67, 33), (screen_x - 10, y - 15 + wing_flap, 22, 10))
+        pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - 10, y - 15 + wing_flap, 22, 10), 2)
         # Head (natural brown)
-        pygame.draw.circle(screen, (160, 82, 45), (int(screen_x + 12), int(self.y - 10)), 10)
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 12), int(self.y - 10)), 10, 3)
+        pygame.draw.circle(screen, (160, 82, 45), (int(screen_x + 12), int(y - 10)), 10)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 12), int(y - 10)), 10, 3)
         # Beak (orange/yellow)
-        pygame.draw.polygon(screen, (255, 140, 0), [(screen_x + 20, self.y - 10), (screen_x + 28, self.y - 7), (screen_x + 20, self.y - 4)])
-        pygame.draw.polygon(screen, RETRO_BLACK, [(screen_x + 20, self.y - 10), (screen_x + 28, self.y - 7), (screen_x + 20, self.y - 4)], 2)
+        pygame.draw.polygon(screen, (255, 140, 0), [(screen_x + 20, y - 10), (screen_x + 28, y - 7), (screen_x + 20, y - 4)])
+        pygame.draw.polygon(screen, RETRO_BLACK, [(screen_x + 20, y - 10), (screen_x + 28, y - 7), (screen_x + 20, y - 4)], 2)
         # Eye
-        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 15), int(self.y - 12)), 2)
-        pygame.draw.circle(screen, RETRO_WHITE, (int(screen_x + 16), int(self.y - 13)), 1)
+        pygame.draw.circle(screen, RETRO_BLACK, (int(screen_x + 15), int(y - 12)), 2)
+        pygame.draw.circle(screen, RETRO_WHITE, (int(screen_x + 16), int(y - 13)), 1)
         # Tail feathers (static)
-        pygame.draw.line(screen, (101, 67, 33), (screen_x - 15, self.y - 5), (screen_x - 22, self.y - 8), 3)
-        pygame.draw.line(screen, (101, 67, 33), (screen_x - 15, self.y), (screen_x - 22, self.y - 2), 3)
+        pygame.draw.line(screen, (101, 67, 33), (screen_x - 15, y - 5), (screen_x - 22, y - 8), 3)
+        pygame.draw.line(screen, (101, 67, 33), (screen_x - 15, y), (screen_x - 22, y - 2), 3)
+
+class AnimalAtlas:
+    """Sprite atlas with every animal type pre-rendered into one surface"""
+    ANIMAL_TYPES = ["elephant", "tiger", "deer", "bear", "squirrel", "bird", "monkey"]
+    ANIMATED_TYPES = ["bird", "monkey"]
+    ANIMATION_PHASES = 8  # Pre-rendered frames for monkey arms and bird wings
+    CELL_SIZE = (128, 88)
+    CELL_ANCHOR = (76, 44)  # Animal position inside its cell
+    COLUMNS = 7
+    
+    surface = None
+    cells = {}  # (animal_type, phase) -> source rect in the atlas
+    
+    @classmethod
+    def build(cls):
+        """Render every animal type and animation phase into the atlas (once)"""
+        if cls.surface is not None:
+            return cls.surface
+        
+        frames = []
+        for animal_type in cls.ANIMAL_TYPES:
+            phases = cls.ANIMATION_PHASES if animal_type in cls.ANIMATED_TYPES else 1
+            for phase in range(phases):
+                frames.append((animal_type, phase))
+        
+        rows = (len(frames) + cls.COLUMNS - 1) // cls.COLUMNS
+        cell_width, cell_height = cls.CELL_SIZE
+        atlas = pygame.Surface((cell_width * cls.COLUMNS, cell_height * rows), pygame.SRCALPHA)
+        cells = {}
+        for index, (animal_type, phase) in enumerate(frames):
+            cell = pygame.Rect((index % cls.COLUMNS) * cell_width, (index // cls.COLUMNS) * cell_height, cell_width, cell_height)
+            x = cell.x + cls.CELL_ANCHOR[0]
+            y = cell.y + cls.CELL_ANCHOR[1]
+            drawer = getattr(Animal, f"draw_{animal_type}")
+            # Clip so a stray stroke can never bleed into a neighbouring cell
+            atlas.set_clip(cell)
+            if animal_type in cls.ANIMATED_TYPES:
+                drawer(atlas, x, y, phase * 2 * math.pi / cls.ANIMATION_PHASES)
+            else:
+                drawer(atlas, x, y)
+            cells[(animal_type, phase)] = cell
+        atlas.set_clip(None)
+        
+        cls.surface = ASSETS.prepare(atlas, alpha=True)
+        # Cell sizes divide by every pixel scale, so the shrunk cells still tile the atlas
+        cls.cells = {key: ASSETS.scaled(cell) for key, cell in cells.items()}
+        return cls.surface
+    
+    @classmethod
+    def get_cell(cls, animal_type, phase=0):
+        """Return the atlas source rect for an animal type and phase"""
+        if cls.surface is None:
+            cls.build()
+        return cls.cells[(animal_type, phase)]
+    
+    @classmethod
+    def memory_size(cls):
+        """Return the atlas pixel memory in bytes (0 if not built yet)"""
+        return AssetManager.surface_bytes(cls.surface)
+    
+    @classmethod
+    def rebuild(cls):
+        """Render the atlas again, e.g. after the display format changed"""
+        cls.surface = None
+        cls.cells = {}
+        return cls.build()
+
+class AnimalGrid:
+    """Spatial hash of animals by world x bucket; animals near the view update every step, the rest sleep"""
+    BUCKET_WIDTH = 256
+    ACTIVE_MARGIN = 400   # Animals this far outside the view still update every step
+    SLEEP_INTERVAL = 8    # Sleeping buckets catch up once every this many steps, staggered by bucket
+
+    def __init__(self, animals=(), bucket_width=BUCKET_WIDTH):
+        self.bucket_width = bucket_width
+        self.buckets = {}  # Bucket -> list of [animal, step it has been updated to]
+        self.count = 0
+        self.step = 0
+        self.active = 0
+        self.sleeping = 0
+        for animal in animals:
+            self.add(animal)
+
+    def bucket_of(self, x):
+        return int(x) // self.bucket_width
+
+    def add(self, animal):
+        self.buckets.setdefault(self.bucket_of(animal.x), []).append([animal, self.step])
+        self.count += 1
+
+    def update(self, view_x, view_width=SCREEN_WIDTH):
+        """Advance one step and move animals that walked into another bucket"""
+        self.step += 1
+        step = self.step
+        active = range(self.bucket_of(view_x - self.ACTIVE_MARGIN),
+                       self.bucket_of(view_x + view_width + self.ACTIVE_MARGIN) + 1)
+        self.active = self.sleeping = 0
+        moved = []
+        for bucket, entries in self.buckets.items():
+            if bucket in active:
+                self.active += len(entries)
+            else:
+                self.sleeping += len(entries)
+                if (bucket + step) % self.SLEEP_INTERVAL:
+                    continue
+            for entry in entries:
+                animal = entry[0]
+                animal.update(step - entry[1])
+                entry[1] = step
+                if self.bucket_of(animal.x) != bucket:
+                    moved.append((bucket, entry))
+
+        for bucket, entry in moved:
+            entries = self.buckets[bucket]
+            entries.remove(entry)
+            if not entries:
+                del self.buckets[bucket]
+            self.buckets.setdefault(self.bucket_of(entry[0].x), []).append(entry)
+
+    def query(self, start_x, end_x):
+        """Yield the animals in the buckets covering start_x..end_x, in bucket order"""
+        for bucket in range(self.bucket_of(start_x), self.bucket_of(end_x) + 1):
+            for entry in self.buckets.get(bucket, ()):
+                yield entry[0]
+
+    def submit(self, queue, start_x, end_x):
+        """Queue the animals around start_x..end_x"""
+        for animal in self.query(start_x, end_x):
+            animal.submit(queue)
+
+    def stats(self):
+        """Return the animals updated every step and the sleeping ones, as of the last update"""
+        return {"active": self.active, "sleeping": self.sleeping}
+
+    def __iter__(self):
+        for entries in self.buckets.values():
+            for entry in entries:
+                yield entry[0]
+
+    def __len__(self):
+        return self.count
+
+class WildlifeHerd:
+    """Struct-of-arrays animal population advanced with NumPy, for very large herds (needs numpy)
+
+    Mirrors Animal.update per type: squirrels, monkeys and birds wander and turn at random,
+    birds bob up and down, the big animals stand still.
+    """
+    TYPES = ("elephant", "tiger", "deer", "bear", "squirrel", "bird", "monkey")
+    SPAWN_TYPES = ("elephant", "tiger", "deer", "bear", "squirrel", "bird")  # As Game.generate_animals
+    TURN_CHANCE = (0, 0, 0, 0, 1 / 1001, 1 / 801, 1 / 1001)  # Per step, by type code
+    BIRD = TYPES.index("bird")
+    MONKEY = TYPES.index("monkey")
+
+    def __init__(self, xs, ys, kinds, directions, speeds, seed=None):
+        if np is None:
+            raise ImportError("WildlifeHerd needs numpy")
+        self.x = np.asarray(xs, dtype=np.float64)
+        self.y = np.asarray(ys, dtype=np.float64)
+        self.kind = np.asarray(kinds, dtype=np.uint8)
+        self.direction = np.asarray(directions, dtype=np.int8)
+        self.speed = np.asarray(speeds, dtype=np.float64)
+        self.frame = np.zeros(len(self.x))
+        self.rng = np.random.default_rng(seed)
+        # Only wandering animals need random turns and movement, only birds bob
+        self.movers = np.flatnonzero(np.asarray(self.TURN_CHANCE)[self.kind] > 0)
+        self.turn_chance = np.asarray(self.TURN_CHANCE)[self.kind[self.movers]]
+        self.birds = np.flatnonzero(self.kind == self.BIRD)
+
+    @classmethod
+    def from_animals(cls, animals, seed=None):
+        """Copy existing Animal objects into a herd"""
+        animals = list(animals)
+        herd = cls([a.x for a in animals], [a.y for a in animals], [cls.TYPES.index(a.type) for a in animals],
+                   [a.direction for a in animals], [a.speed for a in animals], seed)
+        herd.frame[:] = [a.animation_frame for a in animals]
+        return herd
+
+    @classmethod
+    def generate(cls, count, terrain_height, seed=None):
+        """Scatter count animals over the terrain, placed like Game.generate_animals"""
+        if np is None:
+            raise ImportError("WildlifeHerd needs numpy")
+        rng = np.random.default_rng(seed)
+        world_width = len(terrain_height)
+        xs = rng.integers(120, world_width - 120, count)
+        kinds = np.asarray([cls.TYPES.index(t) for t in cls.SPAWN_TYPES], dtype=np.uint8)[
+            rng.integers(0, len(cls.SPAWN_TYPES), count)]
+        # Birds fly higher, squirrels sit in trees, the rest stand on the ground
+        lift = rng.integers(25, 46, count)
+        lift = np.where(kinds == cls.BIRD, rng.integers(100, 181, count), lift)
+        lift = np.where(kinds == cls.TYPES.index("squirrel"), rng.integers(60, 101, count), lift)
+        ys = np.asarray(terrain_height, dtype=np.float64)[xs] - lift
+        directions = rng.choice(np.array([-1, 1], dtype=np.int8), count)
+        speeds = rng.uniform(0.3, 1.5, count)
+        return cls(xs, ys, kinds, directions, speeds, seed=rng)
+
+    def advance(self, ticks=1):
+        """Advance every animal by ticks steps with a handful of array operations"""
+        start_frame = self.frame[self.birds] if len(self.birds) else None
+        self.frame += 0.02 * ticks
+
+        movers = self.movers
+        if len(movers):
+            # Turn when an odd number of turns happened over the ticks
+            chance = self.turn_chance if ticks == 1 else (1 - (1 - 2 * self.turn_chance) ** ticks) / 2
+            turned = movers[self.rng.random(len(movers)) < chance]
+            self.direction[turned] *= -1
+            self.x[movers] += self.direction[movers] * self.speed[movers] * (0.1 * ticks)
+
+        if start_frame is not None:
+            # Sum of the per-step bob 0.2 * sin(0.5 * frame) over the ticks, in closed form
+            half_step = 0.005
+            self.y[self.birds] += (0.2 * math.sin(ticks * half_step) / math.sin(half_step)
+                                   * np.sin(0.5 * start_frame + (ticks + 1) * half_step))
+
+    def update(self, view_x=None, view_width=SCREEN_WIDTH):
+        """Advance one step; the whole herd is cheap enough to update regardless of the view"""
+        self.advance()
+
+    def phases(self, indices):
+        """Atlas animation phases for the animals at indices (see Animal.get_phase)"""
+        if not Animal.animate:
+            return np.zeros(len(indices), dtype=np.intp)
+        kind = self.kind[indices]
+        angle = np.where(kind == self.BIRD, self.frame[indices] * 4, self.frame[indices])
+        phases = (angle / (2 * math.pi) * AnimalAtlas.ANIMATION_PHASES).astype(np.intp) % AnimalAtlas.ANIMATION_PHASES
+        return np.where((kind == self.BIRD) | (kind == self.MONKEY), phases, 0)
+
+    def submit(self, queue, start_x, end_x):
+        """Queue the animals between start_x and end_x"""
+        visible = np.flatnonzero((self.x >= start_x) & (self.x <= end_x))
+        anchor_x, anchor_y = AnimalAtlas.CELL_ANCHOR
+        for x, y, kind, phase in zip(self.x[visible].tolist(), self.y[visible].tolist(),
+                                     self.kind[visible].tolist(), self.phases(visible).tolist()):
+            queue.submit(RenderQueue.ANIMALS, AnimalAtlas.surface, x - anchor_x, y - anchor_y,
+                         AnimalAtlas.get_cell(self.TYPES[kind], phase))
+
+    def stats(self):
+        return {"active": len(self), "sleeping": 0}
+
+    def memory_size(self):
+        """Bytes held by the per-animal arrays"""
+        return sum(values.nbytes for values in (self.x, self.y, self.kind, self.direction, self.speed, self.frame))
+
+    def __len__(self):
+        return len(self.x)
 
 class RefuelMenu:
     def __init__(self):
@@ -562,6 +1095,18 @@ class RefuelMenu:
             {"text": "Continue with Current Fuel", "fuel": 0, "description": "Resume without refueling"}
         ]
         self.title_animation = 0
+    
+    # Shared full-screen dimming overlay, allocated on first use
+    overlay = None
+    
+    @classmethod
+    def get_overlay(cls):
+        """Return the semi-transparent black overlay used to dim the world"""
+        if cls.overlay is None:
+            cls.overlay = ASSETS.create(ASSETS.scaled((SCREEN_WIDTH, SCREEN_HEIGHT)))
+            cls.overlay.set_alpha(180)
+            cls.overlay.fill(RETRO_BLACK)
+        return cls.overlay
         
     def update(self):
         self.title_animation += 0.03
@@ -578,19 +1123,24 @@ class RefuelMenu:
             return self.selected_option
         return -1
     
-    def draw(self, screen, current_fuel=15):
-        # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill(RETRO_BLACK)
-        screen.blit(overlay, (0, 0))
+    def dirty_rects(self):
+        """Screen regions that may have changed since the previous frame"""
+        # The title and gauge bob inside the panel; the world behind is frozen
+        return [pygame.Rect(SCREEN_WIDTH//2 - 350, SCREEN_HEIGHT//2 - 250, 700, 500)]
+    
+    def draw(self, screen, current_fuel=15, draw_overlay=True):
+        # Semi-transparent overlay (skipped when drawing over an already dimmed snapshot)
+        if draw_overlay:
+            screen.blit(self.get_overlay(), (0, 0))
         
         # Refuel panel
         panel_width = 700
         panel_height = 500
+        # Layout is in full-resolution coordinates; ASSETS.scaled maps it to the render target
+        scaled = ASSETS.scaled
         panel = pygame.Rect(SCREEN_WIDTH//2 - panel_width//2, SCREEN_HEIGHT//2 - panel_height//2, panel_width, panel_height)
-        pygame.draw.rect(screen, RETRO_BLACK, panel)
-        pygame.draw.rect(screen, RETRO_YELLOW, panel, 5)
+        pygame.draw.rect(screen, RETRO_BLACK, scaled(panel))
+        pygame.draw.rect(screen, RETRO_YELLOW, scaled(panel), ASSETS.line_width(5))
         
         # Title
         title_y = SCREEN_HEIGHT//2 - 200 + math.sin(self.title_animation) * 5
@@ -604,13 +1154,13 @@ class RefuelMenu:
         gauge_height = 20
         
         # Empty gauge
-        pygame.draw.rect(screen, RETRO_BLACK, (gauge_x, gauge_y, gauge_width, gauge_height))
-        pygame.draw.rect(screen, RETRO_WHITE, (gauge_x, gauge_y, gauge_width, gauge_height), 3)
+        pygame.draw.rect(screen, RETRO_BLACK, scaled((gauge_x, gauge_y, gauge_width, gauge_height)))
+        pygame.draw.rect(screen, RETRO_WHITE, scaled((gauge_x, gauge_y, gauge_width, gauge_height)), ASSETS.line_width(3))
         
         # Current fuel level
         fuel_fill = (current_fuel / 100) * gauge_width
         fuel_color = RETRO_RED if current_fuel < 25 else RETRO_YELLOW if current_fuel < 50 else RETRO_BLUE
-        pygame.draw.rect(screen, fuel_color, (gauge_x + 2, gauge_y + 2, fuel_fill, gauge_height - 4))
+        pygame.draw.rect(screen, fuel_color, scaled((gauge_x + 2, gauge_y + 2, fuel_fill, gauge_height - 4)))
         
         RetroFont.render_retro_text(screen, f"Current Fuel: {int(current_fuel)}%", gauge_x, gauge_y + 30, 24, RETRO_WHITE, False)
         
@@ -623,8 +1173,8 @@ class RefuelMenu:
             # Option background
             if is_selected:
                 option_rect = pygame.Rect(SCREEN_WIDTH//2 - 320, y_pos - 8, 640, 50)
-                pygame.draw.rect(screen, RETRO_YELLOW, option_rect)
-                pygame.draw.rect(screen, RETRO_BLACK, option_rect, 3)
+                pygame.draw.rect(screen, RETRO_YELLOW, scaled(option_rect))
+                pygame.draw.rect(screen, RETRO_BLACK, scaled(option_rect), ASSETS.line_width(3))
             
             # Selection arrow
             if is_selected:
@@ -633,7 +1183,7 @@ class RefuelMenu:
                     (SCREEN_WIDTH//2 - 280, y_pos + 22),
                     (SCREEN_WIDTH//2 - 300, y_pos + 32)
                 ]
-                pygame.draw.polygon(screen, RETRO_BLACK if is_selected else RETRO_YELLOW, arrow_points)
+                pygame.draw.polygon(screen, RETRO_BLACK if is_selected else RETRO_YELLOW, scaled(arrow_points))
             
             # Option text
             color = RETRO_BLACK if is_selected else RETRO_WHITE
@@ -647,6 +1197,14 @@ class RefuelMenu:
         RetroFont.render_retro_text(screen, "↑↓ Navigate    ENTER Select", SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 + 200, 24, RETRO_GREEN, True)
 
 class Obstacle:
+    # Optional sharing of baked surfaces between obstacles of the same (type, width, height)
+    share_surfaces = False
+    _shared_surfaces = {}
+    # Otherwise each obstacle is baked on first draw into an LRU cache, so huge worlds only hold the ones in view
+    _baked = OrderedDict()
+    MAX_BAKED = 256
+    textured = True  # Detail setting: highlights, stone dots, wood grain and rings
+    
     def __init__(self, x, y, width, height, obstacle_type="rock"):
         self.x = x
         self.y = y
@@ -655,38 +1213,599 @@ class Obstacle:
         self.rect = pygame.Rect(x - width//2, y - height//2, width, height)
         self.type = obstacle_type
     
-    def draw(self, screen, camera_x):
-        screen_x = self.x - camera_x
-        if -100 < screen_x < SCREEN_WIDTH + 100:  # Only draw if on screen
-            if self.type == "rock":
-                # Retro stone with chunky pixels
-                pygame.draw.ellipse(screen, (120, 120, 120), (screen_x - self.width//2, self.y - self.height//2, self.width, self.height))
-                pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - self.width//2, self.y - self.height//2, self.width, self.height), 4)
+    @property
+    def surface(self):
+        return self.get_surface()
+    
+    def get_surface(self):
+        """Return the baked surface, shared per size when sharing is enabled, otherwise from the LRU cache"""
+        if Obstacle.share_surfaces:
+            key = (self.type, self.width, self.height, Obstacle.textured)
+            surface = Obstacle._shared_surfaces.get(key)
+            if surface is None:
+                surface = self.bake()
+                Obstacle._shared_surfaces[key] = surface
+            return surface
+        surface = Obstacle._baked.get(self)
+        if surface is None:
+            surface = self.bake()
+            Obstacle._baked[self] = surface
+            if len(Obstacle._baked) > Obstacle.MAX_BAKED:
+                Obstacle._baked.popitem(last=False)
+        else:
+            Obstacle._baked.move_to_end(self)
+        return surface
+    
+    @classmethod
+    def clear_surfaces(cls):
+        """Drop every baked surface; they are baked again when next drawn"""
+        cls._shared_surfaces.clear()
+        cls._baked.clear()
+    
+    @classmethod
+    def surface_memory(cls):
+        """Bytes held by baked obstacle surfaces"""
+        surfaces = list(cls._shared_surfaces.values()) + list(cls._baked.values())
+        return sum(AssetManager.surface_bytes(surface) for surface in surfaces)
+    
+    def bake(self):
+        """Render the obstacle once; texture is seeded by position so it is reproducible"""
+        rng = random.Random(f"{self.type}:{self.x}:{self.y}")
+        surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        center_x = self.width // 2
+        center_y = self.height // 2
+        if self.type == "rock":
+            # Retro stone with chunky pixels
+            pygame.draw.ellipse(surface, (120, 120, 120), (0, 0, self.width, self.height))
+            pygame.draw.ellipse(surface, RETRO_BLACK, (0, 0, self.width, self.height), 4)
+            if Obstacle.textured:
                 # Add retro highlights and texture
-                pygame.draw.ellipse(screen, (160, 160, 160), (screen_x - self.width//3, self.y - self.height//3, self.width//2, self.height//2))
-                pygame.draw.ellipse(screen, RETRO_BLACK, (screen_x - self.width//3, self.y - self.height//3, self.width//2, self.height//2), 2)
+                highlight = (center_x - self.width//3, center_y - self.height//3, self.width//2, self.height//2)
+                pygame.draw.ellipse(surface, (160, 160, 160), highlight)
+                pygame.draw.ellipse(surface, RETRO_BLACK, highlight, 2)
                 # Stone texture dots
                 for i in range(3):
-                    dot_x = screen_x + random.randint(-self.width//4, self.width//4)
-                    dot_y = self.y + random.randint(-self.height//4, self.height//4)
-                    pygame.draw.circle(screen, (100, 100, 100), (int(dot_x), int(dot_y)), 3)
-            elif self.type == "log":
-                # Retro wood log
-                log_rect = pygame.Rect(screen_x - self.width//2, self.y - self.height//2, self.width, self.height)
-                pygame.draw.rect(screen, RETRO_BROWN, log_rect)
-                pygame.draw.rect(screen, RETRO_BLACK, log_rect, 4)
+                    dot_x = center_x + rng.randint(-self.width//4, self.width//4)
+                    dot_y = center_y + rng.randint(-self.height//4, self.height//4)
+                    pygame.draw.circle(surface, (100, 100, 100), (dot_x, dot_y), 3)
+        elif self.type == "log":
+            # Retro wood log
+            log_rect = pygame.Rect(0, 0, self.width, self.height)
+            pygame.draw.rect(surface, RETRO_BROWN, log_rect)
+            pygame.draw.rect(surface, RETRO_BLACK, log_rect, 4)
+            if Obstacle.textured:
                 # Wood grain lines
                 for i in range(3):
-                    line_y = self.y - self.height//4 + i * (self.height//4)
-                    pygame.draw.line(screen, (80, 50, 20), (screen_x - self.width//2 + 5, line_y), (screen_x + self.width//2 - 5, line_y), 2)
+                    line_y = center_y - self.height//4 + i * (self.height//4)
+                    pygame.draw.line(surface, (80, 50, 20), (5, line_y), (self.width - 5, line_y), 2)
                 # Log end rings
                 for i in range(2):
-                    ring_x = screen_x - self.width//2 + 15 + i * (self.width - 30)
-                    pygame.draw.circle(screen, (80, 50, 20), (int(ring_x), int(self.y)), 12, 3)
-                    pygame.draw.circle(screen, (60, 40, 15), (int(ring_x), int(self.y)), 8, 2)
-                    pygame.draw.circle(screen, (40, 25, 10), (int(ring_x), int(self.y)), 4)
+                    ring_x = 15 + i * (self.width - 30)
+                    pygame.draw.circle(surface, (80, 50, 20), (ring_x, center_y), 12, 3)
+                    pygame.draw.circle(surface, (60, 40, 15), (ring_x, center_y), 8, 2)
+                    pygame.draw.circle(surface, (40, 25, 10), (ring_x, center_y), 4)
+        return ASSETS.prepare(surface, alpha=True)
+    
+    def submit(self, queue):
+        queue.submit(RenderQueue.OBSTACLES, self.surface, self.x - self.width//2, self.y - self.height//2)
+
+class ObstacleIndex:
+    """Obstacles kept sorted by centre x with a range query for collision and culling"""
+
+    def __init__(self, obstacles=()):
+        self.xs = array('i')  # Centre x of each obstacle, ascending
+        self.items = []
+        self.reach = 0        # Widest half-width, so a range query can't miss an overlapping obstacle
+        for obstacle in obstacles:
+            self.add(obstacle)
+
+    def add(self, obstacle):
+        """Insert an obstacle, keeping equal positions in insertion order"""
+        x = obstacle.rect.centerx
+        i = bisect_right(self.xs, x)
+        self.xs.insert(i, x)
+        self.items.insert(i, obstacle)
+        self.reach = max(self.reach, obstacle.rect.width // 2 + 1)
+
+    def query(self, start_x, end_x):
+        """Return the obstacles whose horizontal extent overlaps [start_x, end_x), in x order"""
+        first = bisect_left(self.xs, start_x - self.reach)
+        last = bisect_right(self.xs, end_x + self.reach)
+        return [obstacle for obstacle in self.items[first:last]
+                if obstacle.rect.right > start_x and obstacle.rect.left < end_x]
+
+    def colliding(self, rect):
+        """Return the obstacles whose rect collides with rect, in x order"""
+        return [obstacle for obstacle in self.query(rect.left, rect.right) if rect.colliderect(obstacle.rect)]
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+class TerrainGenerator:
+    """Ground height per world column: rolling hills plus noise, rising into a mountain at the end"""
+    # hill and noise are (frequency, amplitude) sine waves; the mountain starts at a fraction of the world
+    PROFILES = {
+        "jungle": {"base": SCREEN_HEIGHT - 120, "hill": (0.008, 60), "noise": (0.05, 20),
+                   "mountain_start": 0.75, "mountain_height": 250, "floor": 150},
+        # Same track as offroad_jeep_adventure.py, which keeps its own loop to stay self-contained
+        "offroad": {"base": SCREEN_HEIGHT - 100, "hill": (0.01, 50), "noise": (0, 0),
+                    "mountain_start": 0.8, "mountain_height": 200, "floor": 100},
+    }
+
+    @classmethod
+    def generate(cls, world_width, profile="jungle", seed=None):
+        """Return float32 heights for world_width columns (NumPy array, or array('f') without NumPy)
+
+        seed shifts the hill and noise phases; None gives the classic track.
+        """
+        params = cls.PROFILES[profile]
+        if seed is None:
+            hill_phase = noise_phase = 0.0
+        else:
+            rng = random.Random(f"terrain:{seed}")
+            hill_phase, noise_phase = rng.uniform(0, 2 * math.pi), rng.uniform(0, 2 * math.pi)
+        if np is None:
+            return cls.generate_python(world_width, params, hill_phase, noise_phase)
+
+        hill_freq, hill_amp = params["hill"]
+        noise_freq, noise_amp = params["noise"]
+        x = np.arange(world_width, dtype=np.float64)
+        height = params["base"] - np.sin(x * hill_freq + hill_phase) * hill_amp
+        if noise_amp:
+            height -= np.sin(x * noise_freq + noise_phase) * noise_amp
+        mountain_x = world_width * params["mountain_start"]
+        mountain = x > mountain_x
+        height[mountain] -= (x[mountain] - mountain_x) / (world_width - mountain_x) * params["mountain_height"]
+        return np.maximum(height, params["floor"]).astype(np.float32)
+
+    @staticmethod
+    def generate_python(world_width, params, hill_phase, noise_phase):
+        """Pure-Python fallback producing the same profile"""
+        hill_freq, hill_amp = params["hill"]
+        noise_freq, noise_amp = params["noise"]
+        mountain_x = world_width * params["mountain_start"]
+        terrain = array('f')
+        for x in range(world_width):
+            height = params["base"] - math.sin(x * hill_freq + hill_phase) * hill_amp - math.sin(x * noise_freq + noise_phase) * noise_amp
+            if x > mountain_x:
+                height -= (x - mountain_x) / (world_width - mountain_x) * params["mountain_height"]
+            terrain.append(max(params["floor"], height))
+        return terrain
+
+class TerrainBuffer:
+    """Ground heights stored as float32 (4 bytes per column), read like a list: terrain[x], len(terrain)"""
+
+    def __init__(self, heights=()):
+        self.shared = None  # SharedMemory block backing the heights, when attached to one
+        if isinstance(heights, array) and heights.typecode == 'f':
+            self.heights = heights
+        elif np is not None and isinstance(heights, np.ndarray):
+            self.heights = array('f')
+            self.heights.frombytes(heights.astype(np.float32, copy=False).tobytes())
+        else:
+            self.heights = array('f', heights)
+
+    def __getitem__(self, x):
+        return self.heights[x]
+
+    def __len__(self):
+        return len(self.heights)
+
+    def height_at(self, x, default=SCREEN_HEIGHT - 100):
+        """Ground height under world x, or default outside the world"""
+        x = int(x)
+        return self.heights[x] if 0 <= x < len(self.heights) else default
+
+    def as_numpy(self):
+        """Zero-copy float32 NumPy view of the heights (needs numpy)"""
+        return np.frombuffer(self.heights, dtype=np.float32)
+
+    def __array__(self, dtype=None, copy=None):
+        heights = self.as_numpy()
+        return heights if dtype is None else heights.astype(dtype)
+
+    def memory_size(self):
+        """Bytes used by the heights"""
+        return len(self.heights) * 4
+
+    def share(self):
+        """Copy the heights into a new shared memory block for other processes to attach() to
+
+        The caller owns the returned SharedMemory: close() and unlink() it when done.
+        """
+        from multiprocessing import shared_memory
+        block = shared_memory.SharedMemory(create=True, size=max(1, self.memory_size()))
+        block.buf[:self.memory_size()] = memoryview(self.heights).cast('B')
+        return block
+
+    @classmethod
+    def attach(cls, name, length):
+        """Read length heights from a shared memory block created by share(), without copying"""
+        from multiprocessing import shared_memory
+        block = shared_memory.SharedMemory(name=name)
+        terrain = cls.__new__(cls)
+        terrain.shared = block
+        terrain.heights = block.buf[:length * 4].cast('f')
+        return terrain
+
+    def close(self):
+        """Detach from the shared memory block, if any"""
+        if self.shared is not None:
+            self.heights.release()
+            self.heights = array('f')
+            self.shared.close()
+            self.shared = None
+
+class GrassLayer:
+    """Grass tufts generated once per world from a seed"""
+    SPACING = 3      # A tuft on every third terrain column
+    BLADES = 3       # Blades per tuft, 5 px apart
+    MIN_HEIGHT = 5
+    MAX_HEIGHT = 15
+    REACH = 7        # How far a tuft's blades reach sideways from its column
+    COLOR = DARK_GREEN
+    
+    def __init__(self, world_width, heights):
+        self.world_width = world_width
+        self.heights = heights  # array('B'), BLADES entries per tuft
+    
+    @classmethod
+    def generate(cls, world_width, seed):
+        """Pick every blade height up front so the grass never changes between frames"""
+        blade_count = (world_width + cls.SPACING - 1) // cls.SPACING * cls.BLADES
+        heights = array('B')
+        if np is not None:
+            rng = np.random.default_rng(seed)
+            heights.frombytes(rng.integers(cls.MIN_HEIGHT, cls.MAX_HEIGHT + 1, blade_count, dtype=np.uint8).tobytes())
+        else:
+            # choices() draws in bulk, far faster than one randint() per blade
+            rng = random.Random(seed)
+            heights.extend(rng.choices(range(cls.MIN_HEIGHT, cls.MAX_HEIGHT + 1), k=blade_count))
+        return cls(world_width, heights)
+    
+    def tufts_between(self, start_x, end_x):
+        """Return the terrain columns with a tuft in [start_x, end_x)"""
+        first = max(0, (start_x + self.SPACING - 1) // self.SPACING) * self.SPACING
+        return range(first, min(end_x, self.world_width), self.SPACING)
+    
+    def draw(self, surface, terrain_height, start_x, end_x, origin_x=0, origin_y=0):
+        """Draw the tufts rooted in [start_x, end_x), offset by the surface's world origin"""
+        for x in self.tufts_between(start_x, end_x):
+            y = terrain_height[x] - origin_y
+            base = (x // self.SPACING) * self.BLADES
+            for j in range(self.BLADES):
+                grass_x = x - origin_x + j * 5 - 5
+                pygame.draw.line(surface, self.COLOR, (grass_x, y), (grass_x, y - self.heights[base + j]), 2)
+
+class TerrainChunkCache:
+    """Terrain rasterized lazily into fixed-width strips kept in an LRU cache"""
+    CHUNK_WIDTH = 256
+    MAX_CHUNKS = 12  # Enough for a full screen plus some slack when scrolling back
+    GROUND_COLOR = (34, 100, 34)
+    COLORKEY = (255, 0, 255)  # Transparent sky above the ground line
+    
+    def __init__(self, terrain_height, grass=None, height=SCREEN_HEIGHT, chunk_width=CHUNK_WIDTH, max_chunks=MAX_CHUNKS):
+        self.terrain_height = terrain_height
+        self.grass = grass  # Optional GrassLayer baked into the strips
+        self.height = height
+        self.chunk_width = chunk_width
+        self.max_chunks = max_chunks
+        self.chunks = OrderedDict()  # chunk index -> (surface, top)
+        self.hits = 0
+        self.misses = 0
+    
+    def chunk_count(self):
+        """Number of chunks covering the whole world"""
+        return (len(self.terrain_height) + self.chunk_width - 1) // self.chunk_width
+    
+    def render_chunk(self, index):
+        """Rasterize one strip of terrain; only the rows below its highest point are kept"""
+        start_x = index * self.chunk_width
+        end_x = min(start_x + self.chunk_width, len(self.terrain_height))
+        # Include the first column of the next chunk so neighbouring strips join up
+        columns = range(start_x, min(end_x + 1, len(self.terrain_height)))
+        top = min(self.terrain_height[x] for x in columns) - 2
+        if self.grass is not None:
+            # Tufts rooted just outside the strip can still reach into it
+            tufts = self.grass.tufts_between(start_x - GrassLayer.REACH, end_x + GrassLayer.REACH)
+            if tufts:
+                top = min(top, min(self.terrain_height[x] for x in tufts) - GrassLayer.MAX_HEIGHT - 2)
+        top = max(0, int(top))
+        top -= top % ASSETS.pixel_scale  # Shrunk strips must still reach the bottom of the screen
+        
+        surface = pygame.Surface((end_x - start_x, max(1, self.height - top)))
+        surface.fill(self.COLORKEY)
+        
+        ground_points = [(x - start_x, self.terrain_height[x] - top) for x in columns]
+        bottom = self.height - top
+        if len(ground_points) > 1:
+            # Main ground color
+            pygame.draw.polygon(surface, self.GROUND_COLOR,
+                                [(0, bottom)] + ground_points + [(ground_points[-1][0], bottom)])
+            # Ground texture line along the surface
+            pygame.draw.lines(surface, RETRO_BLACK, False, ground_points, 2)
+        if self.grass is not None:
+            self.grass.draw(surface, self.terrain_height, start_x - GrassLayer.REACH, end_x + GrassLayer.REACH, start_x, top)
+        return ASSETS.prepare(surface, colorkey=self.COLORKEY), top
+    
+    def get_chunk(self, index):
+        """Return (surface, top) for a chunk, rendering it on first view"""
+        chunk = self.chunks.get(index)
+        if chunk is not None:
+            self.chunks.move_to_end(index)
+            self.hits += 1
+            return chunk
+        
+        self.misses += 1
+        chunk = self.render_chunk(index)
+        self.chunks[index] = chunk
+        while len(self.chunks) > self.max_chunks:
+            self.chunks.popitem(last=False)
+        return chunk
+    
+    def draw(self, screen, camera_x):
+        """Blit only the chunks overlapping the camera window"""
+        first = max(0, int(camera_x) // self.chunk_width)
+        last = min(self.chunk_count() - 1, int(camera_x + screen.get_width() * ASSETS.pixel_scale) // self.chunk_width)
+        for index in range(first, last + 1):
+            surface, top = self.get_chunk(index)
+            screen.blit(surface, ASSETS.scaled((index * self.chunk_width - camera_x, top)))
+    
+    def clear(self):
+        """Drop all rendered chunks"""
+        self.chunks.clear()
+    
+    def memory_size(self):
+        """Pixel memory held by cached chunks in bytes"""
+        return sum(AssetManager.surface_bytes(surface) for surface, _ in self.chunks.values())
+
+class SceneryIndex:
+    """Static trees and bushes stored in compact x-sorted arrays"""
+    TREE = 0
+    BUSH = 1
+    SPACING = 200  # Fixed spacing between scenery elements
+    
+    def __init__(self):
+        self.xs = array('i')     # World x positions, ascending
+        self.kinds = array('B')  # TREE or BUSH
+        self.sizes = array('B')  # Element size in pixels
+    
+    @classmethod
+    def generate(cls, world_width, spacing=SPACING):
+        """Build the scenery for a world once (deterministic, based on position)"""
+        scenery = cls()
+        for x in range(0, world_width, spacing):
+            kind = cls.TREE if (x // spacing) % 3 == 0 else cls.BUSH
+            size = 35 + ((x // 100) % 3) * 10  # Deterministic size based on position
+            scenery.add(x, kind, size)
+        return scenery
+    
+    def add(self, x, kind, size):
+        """Append an element; elements must be added in increasing x order"""
+        if self.xs and x < self.xs[-1]:
+            raise ValueError("Scenery must be added in increasing x order")
+        self.xs.append(x)
+        self.kinds.append(kind)
+        self.sizes.append(size)
+    
+    def query(self, start_x, end_x):
+        """Return the (first, last) index range of elements with start_x <= x <= end_x"""
+        return bisect_left(self.xs, start_x), bisect_right(self.xs, end_x)
+    
+    def __len__(self):
+        return len(self.xs)
+    
+    # Pre-rendered sprites keyed by (kind, size) -> (surface, offset from the element's anchor)
+    _sprites = {}
+    COLORKEY = (255, 0, 255)
+    
+    @classmethod
+    def get_sprite(cls, kind, size):
+        """Return (surface, dx, dy) for a scenery element, rendering it on first use"""
+        sprite = cls._sprites.get((kind, size))
+        if sprite is None:
+            if kind == cls.TREE:
+                # Canopy centred on the anchor, trunk hanging below it
+                surface = pygame.Surface((size * 2 + 1, size * 2 + 41))
+                surface.fill(cls.COLORKEY)
+                pygame.draw.rect(surface, RETRO_BROWN, (size - 8, size * 2, 16, 40))
+                pygame.draw.circle(surface, DARK_GREEN, (size, size), size)
+                pygame.draw.circle(surface, (0, 80, 0), (size, size), size - 10)
+                sprite = (ASSETS.prepare(surface, colorkey=cls.COLORKEY), -size, -size)
+            else:
+                bush_size = size // 2
+                surface = pygame.Surface((bush_size * 2, bush_size))
+                surface.fill(cls.COLORKEY)
+                pygame.draw.ellipse(surface, JUNGLE_GREEN, (0, 0, bush_size * 2, bush_size))
+                pygame.draw.ellipse(surface, RETRO_BLACK, (0, 0, bush_size * 2, bush_size), 2)
+                sprite = (ASSETS.prepare(surface, colorkey=cls.COLORKEY), -bush_size, -(bush_size // 2))
+            cls._sprites[(kind, size)] = sprite
+        return sprite
+    
+    @classmethod
+    def clear_sprites(cls):
+        cls._sprites.clear()
+    
+    @classmethod
+    def sprite_memory(cls):
+        return sum(AssetManager.surface_bytes(surface) for surface, _, _ in cls._sprites.values())
+
+class ParallaxLayer:
+    """Background layer pre-rendered into a wrap-around strip and scrolled at a fraction of the camera speed"""
+    COLORKEY = (255, 0, 255)
+    
+    def __init__(self, width, height, y, rate):
+        self.surface = pygame.Surface((width, height))
+        self.surface.fill(self.COLORKEY)
+        self.y = y  # Screen row of the strip's top edge
+        self.rate = rate  # 0 stays put, 1 moves with the terrain
+    
+    def draw(self, screen, camera_x):
+        """Blit the strip enough times to span the screen; returns the number of blits"""
+        width = self.surface.get_width()
+        x = -(int(camera_x * self.rate) // ASSETS.pixel_scale % width)
+        y = ASSETS.scaled(self.y)
+        positions = []
+        while x < screen.get_width():
+            positions.append((self.surface, (x, y)))
+            x += width
+        screen.blits(positions, False)
+        return len(positions)
+
+class ParallaxBackground:
+    """Distant mountains, mid-jungle canopy and near foliage behind the terrain"""
+    TILE_WIDTH = 1600  # Each layer repeats after this many pixels
+    STEP = 100  # Spacing of shapes along a layer; must divide TILE_WIDTH
+    
+    def __init__(self, layers):
+        self.layers = layers  # Drawn back to front
+        for layer in layers:
+            layer.surface = ASSETS.prepare(layer.surface, colorkey=ParallaxLayer.COLORKEY)
+        self.blit_count = 0  # Blits used by the last draw
+    
+    @classmethod
+    def generate(cls, seed, width=TILE_WIDTH):
+        """Render all layers once for a world"""
+        rng = random.Random(f"parallax:{seed}")
+        return cls([
+            cls.render_mountains(rng, width),
+            cls.render_canopy(rng, width),
+            cls.render_foliage(rng, width),
+        ])
+    
+    @classmethod
+    def periodic(cls, rng, width, step, make):
+        """Return (x, params) for shapes that repeat seamlessly every `width` pixels"""
+        count = width // step
+        params = [make(rng) for _ in range(count)]
+        jitter = [rng.randint(-step // 3, step // 3) for _ in range(count)]
+        # Shapes near either edge are repeated one tile over so the strip wraps
+        return [(k * step + jitter[k % count], params[k % count]) for k in range(-2, count + 2)]
+    
+    @classmethod
+    def render_mountains(cls, rng, width):
+        layer = ParallaxLayer(width, 190, 230, 0.1)
+        height = layer.surface.get_height()
+        ridge = cls.periodic(rng, width, cls.STEP, lambda r: r.randint(10, 130))
+        points = [(ridge[0][0], height)] + ridge + [(ridge[-1][0], height)]
+        pygame.draw.polygon(layer.surface, (96, 128, 118), points)
+        # Snow caps on peaks that stand above both neighbours
+        for (left_x, left_y), (x, y), (right_x, right_y) in zip(ridge, ridge[1:], ridge[2:]):
+            if y < 60 and y < left_y and y < right_y:
+                cap = [(x, y),
+                       (x + (right_x - x) // 4, y + (right_y - y) // 4),
+                       (x + (left_x - x) // 4, y + (left_y - y) // 4)]
+                pygame.draw.polygon(layer.surface, (220, 228, 224), cap)
+        return layer
+    
+    @classmethod
+    def render_canopy(cls, rng, width):
+        layer = ParallaxLayer(width, 140, 330, 0.3)
+        height = layer.surface.get_height()
+        pygame.draw.rect(layer.surface, (24, 84, 44), (0, 70, width, height - 70))
+        for x, (radius, rise) in cls.periodic(rng, width, cls.STEP // 2, lambda r: (r.randint(28, 48), r.randint(0, 30))):
+            pygame.draw.circle(layer.surface, (24, 84, 44), (x, 70 - rise + radius // 2), radius)
+            pygame.draw.circle(layer.surface, (34, 104, 54), (x - radius // 4, 70 - rise + radius // 4), radius // 2)
+        return layer
+    
+    @classmethod
+    def render_foliage(cls, rng, width):
+        layer = ParallaxLayer(width, 130, 450, 0.6)
+        height = layer.surface.get_height()
+        base = 110  # Bushes sit on this row; below it the strip matches the backdrop ground
+        for x, (size, fronds) in cls.periodic(rng, width, cls.STEP // 2, lambda r: (r.randint(20, 40), r.randint(2, 4))):
+            # Fern fronds behind a round bush
+            for i in range(fronds):
+                tip_x = x + (i - fronds // 2) * size // 2
+                pygame.draw.polygon(layer.surface, (0, 70, 10), [(x - 8, base), (tip_x, base - size - 25), (x + 8, base)])
+            pygame.draw.ellipse(layer.surface, (10, 90, 20), (x - size, base - size, size * 2, size * 2))
+            pygame.draw.ellipse(layer.surface, RETRO_BLACK, (x - size, base - size, size * 2, size * 2), 2)
+        pygame.draw.rect(layer.surface, (34, 100, 34), (0, base, width, height - base))
+        return layer
+    
+    def draw(self, screen, camera_x, depth=None):
+        """Draw the first `depth` layers (default all) back to front; the blit count does not depend on world length"""
+        self.blit_count = sum(layer.draw(screen, camera_x) for layer in self.layers[:depth])
+    
+    def memory_size(self):
+        """Bytes used by the pre-rendered layers"""
+        return sum(AssetManager.surface_bytes(layer.surface) for layer in self.layers)
+
+class FinishFlag:
+    """Finish marker (pole, checkered flag and label) pre-rendered at world load"""
+    # Optional waving flag, played from a few pre-rendered frames
+    animate = False
+    WAVE_FRAMES = 8
+    WAVE_AMPLITUDE = 3
+    FRAME_TICKS = 6  # Game ticks per wave frame
+    MARGIN = 4  # Room around the pole and flag for the thick pole line and the wave
+    FLAG_WIDTH = 80
+    FLAG_HEIGHT = 40
+    POLE_HEIGHT = 100
+    COLORKEY = (255, 0, 255)
+    
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y  # Top of the pole
+        self.frame = 0
+        self.ticks = 0
+        # Label surfaces come from the shared text cache and are drawn alongside the sprite
+        self.bake()
+    
+    def bake(self):
+        """Render the sprite frames (and fetch the label) for the current settings"""
+        self.label = RetroFont.get_text_surfaces("FINISH", 32, RETRO_YELLOW, True)
+        frame_count = self.WAVE_FRAMES if FinishFlag.animate else 1
+        self.frames = [self.render_frame(i / frame_count * 2 * math.pi if FinishFlag.animate else None)
+                       for i in range(frame_count)]
+        self.frame %= frame_count
+    
+    def memory_size(self):
+        """Bytes held by the pre-rendered frames"""
+        return sum(AssetManager.surface_bytes(surface) for surface, _ in self.frames)
+    
+    def render_frame(self, phase=None):
+        """Render pole and flag; phase=None gives the flat flag"""
+        m = self.MARGIN + (self.WAVE_AMPLITUDE if phase is not None else 0)
+        surface = pygame.Surface((self.FLAG_WIDTH + 2 * m, self.POLE_HEIGHT + 2 * m))
+        surface.fill(self.COLORKEY)
+        
+        # Flag pole (retro thick)
+        pygame.draw.line(surface, RETRO_BROWN, (m, m), (m, m + self.POLE_HEIGHT), 8)
+        
+        # Flag (retro checkered), each column shifted by the wave
+        for col in range(8):
+            offset = 0 if phase is None else round(math.sin(phase + col * 0.8) * self.WAVE_AMPLITUDE * col / 7)
+            for row in range(4):
+                color = RETRO_WHITE if (row + col) % 2 == 0 else RETRO_BLACK
+                pygame.draw.rect(surface, color, (m + col * 10, m + row * 10 + offset, 10, 10))
+        
+        if phase is None:
+            pygame.draw.rect(surface, RETRO_BLACK, (m, m, self.FLAG_WIDTH, self.FLAG_HEIGHT), 3)
+        return ASSETS.prepare(surface, colorkey=self.COLORKEY), m
+    
+    def update(self):
+        """Advance the wave animation"""
+        if len(self.frames) > 1:
+            self.ticks += 1
+            if self.ticks >= self.FRAME_TICKS:
+                self.ticks = 0
+                self.frame = (self.frame + 1) % len(self.frames)
+    
+    def submit(self, queue):
+        surface, m = self.frames[self.frame]
+        text_surface, shadow_surface = self.label
+        queue.submit(RenderQueue.FINISH, surface, self.x - m, self.y - m)
+        # "FINISH" label sits above the flag
+        queue.submit(RenderQueue.FINISH, shadow_surface, self.x - 30 + 3, self.y - 40 + 3)
+        queue.submit(RenderQueue.FINISH, text_surface, self.x - 30, self.y - 40)
 
 class Menu:
+    OPTIONS_START_Y = 490  # Moved down to accommodate debug text
+    
     def __init__(self):
         self.selected_option = 0
         self.options = [
@@ -698,6 +1817,8 @@ class Menu:
         self.menu_transition = 0
         self.retro_elements = self.generate_retro_background()
         self.is_paused = False  # Track if coming from pause
+        self.background = None  # Cached static part of the menu screen
+        self.last_presented_options = None  # Selection state pushed to the display last
         
     def set_pause_mode(self, paused=False):
         """Set menu to pause mode"""
@@ -708,6 +1829,8 @@ class Menu:
         else:
             self.options[0] = {"text": "Start the Drive", "description": "Begin your jungle adventure"}
             self.options[1] = {"text": "Rest on Tyres", "description": "Pause the current game"}
+        # Option labels changed - compose the background again on next draw
+        self.background = None
         
     def generate_retro_background(self):
         """Generate retro-style background elements"""
@@ -752,7 +1875,11 @@ class Menu:
                 return 2
         return -1
     
-    def draw(self, screen):
+    def build_background(self, screen):
+        """Compose everything on the menu screen that does not animate"""
+        # Artwork is drawn at full resolution and shrunk once; text is added at the target's size
+        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        
         # Retro sunset/jungle background
         for y in range(0, SCREEN_HEIGHT, 3):
             if y < SCREEN_HEIGHT // 3:
@@ -766,54 +1893,90 @@ class Menu:
             else:
                 # Ground - dark green
                 color = (30, 80, 30)
-            pygame.draw.rect(screen, color, (0, y, SCREEN_WIDTH, 3))
+            pygame.draw.rect(background, color, (0, y, SCREEN_WIDTH, 3))
         
-        # Draw retro background elements
+        # Draw retro background elements (bird wings flap, so they are drawn per frame)
         for element in self.retro_elements:
             if element["type"] == "tree":
-                self.draw_retro_tree(screen, element["x"], element["y"], element["size"])
+                self.draw_retro_tree(background, element["x"], element["y"], element["size"])
             elif element["type"] == "elephant":
-                self.draw_retro_elephant_silhouette(screen, element["x"], element["y"])
+                self.draw_retro_elephant_silhouette(background, element["x"], element["y"])
             elif element["type"] == "tiger":
-                self.draw_retro_tiger_silhouette(screen, element["x"], element["y"])
+                self.draw_retro_tiger_silhouette(background, element["x"], element["y"])
             elif element["type"] == "deer":
-                self.draw_retro_deer_silhouette(screen, element["x"], element["y"])
+                self.draw_retro_deer_silhouette(background, element["x"], element["y"])
             elif element["type"] == "bird":
-                self.draw_retro_bird_silhouette(screen, element["x"], element["y"])
+                self.draw_retro_bird_body(background, element["x"], element["y"])
+        
+        # Large detailed retro jeep
+        jeep_x = SCREEN_WIDTH//2
+        jeep_y = 280
+        self.draw_detailed_retro_jeep(background, jeep_x, jeep_y)
+        
+        # Retro menu box
+        menu_bg = pygame.Rect(SCREEN_WIDTH//2 - 300, 400, 600, 280)
+        pygame.draw.rect(background, RETRO_BLACK, menu_bg)
+        pygame.draw.rect(background, RETRO_WHITE, menu_bg, 5)
+        
+        # Retro instructions box
+        inst_bg = pygame.Rect(SCREEN_WIDTH//2 - 250, SCREEN_HEIGHT - 100, 500, 60)
+        pygame.draw.rect(background, RETRO_BLACK, inst_bg)
+        pygame.draw.rect(background, RETRO_GREEN, inst_bg, 3)
+        
+        background = ASSETS.prepare(background)
+        
+        # Menu title
+        RetroFont.render_retro_text(background, "MISSION CONTROL", SCREEN_WIDTH//2 - 140, 420, 36, RETRO_YELLOW, True)
+        
+        # Unselected option labels (the selection box is drawn over its label each frame)
+        for i, option in enumerate(self.options):
+            y_pos = self.OPTIONS_START_Y + i * 60
+            if self.is_paused and i == 1:  # "Resting on Tyres" - grayed out
+                color = (100, 100, 100)
+            else:
+                color = RETRO_WHITE  # Normal text is white
+            RetroFont.render_retro_text(background, option["text"], SCREEN_WIDTH//2 - 220, y_pos, 38, color, True)
+        
+        # Retro instructions
+        RetroFont.render_retro_text(background, "↑↓ NAVIGATE    ENTER SELECT", SCREEN_WIDTH//2 - 200, SCREEN_HEIGHT - 85, 24, RETRO_GREEN, True)
+        pixel_mode = f"{ASSETS.pixel_scale}x" if ASSETS.pixel_scale > 1 else "OFF"
+        hint = f"ESC RETURN TO MENU    X PIXEL MODE: {pixel_mode}"
+        hint_width = RetroFont.get_font(20).size(hint)[0]
+        RetroFont.render_retro_text(background, hint, SCREEN_WIDTH//2 - hint_width//2, SCREEN_HEIGHT - 60, 20, RETRO_WHITE, False)
+        
+        self.background = background
+        return background
+    
+    def draw(self, screen):
+        # Static scene from the cache, rebuilt only when labels or resolution change
+        if self.background is None or self.background.get_size() != screen.get_size():
+            self.build_background(screen)
+        screen.blit(self.background, (0, 0))
+        
+        # Animated bird wings
+        for element in self.retro_elements:
+            if element["type"] == "bird":
+                self.draw_retro_bird_wing(screen, element["x"], element["y"])
         
         # Retro title with chunky pixels
         title_y = 80 + math.sin(self.title_animation) * 8
         
         # Title background (retro style)
-        title_bg = pygame.Rect(SCREEN_WIDTH//2 - 350, title_y - 60, 700, 120)
+        title_bg = ASSETS.scaled(pygame.Rect(SCREEN_WIDTH//2 - 350, title_y - 60, 700, 120))
         pygame.draw.rect(screen, RETRO_BLACK, title_bg)
-        pygame.draw.rect(screen, RETRO_YELLOW, title_bg, 6)
+        pygame.draw.rect(screen, RETRO_YELLOW, title_bg, ASSETS.line_width(6))
         
         # Chunky retro title
         RetroFont.render_retro_text(screen, "  JUNGLE DRIVE", SCREEN_WIDTH//2 - 220, title_y - 30, 72, RETRO_YELLOW, True)
         RetroFont.render_retro_text(screen, "    *** MILITARY ADVENTURE ***", SCREEN_WIDTH//2 - 240, title_y + 25, 32, RETRO_WHITE, True)
         
-        # Large detailed retro jeep
-        jeep_x = SCREEN_WIDTH//2
-        jeep_y = 280
-        self.draw_detailed_retro_jeep(screen, jeep_x, jeep_y)
-        
-        # Retro menu box
-        menu_bg = pygame.Rect(SCREEN_WIDTH//2 - 300, 400, 600, 280)
-        pygame.draw.rect(screen, RETRO_BLACK, menu_bg)
-        pygame.draw.rect(screen, RETRO_WHITE, menu_bg, 5)
-        
-        # Menu title
-        RetroFont.render_retro_text(screen, "MISSION CONTROL", SCREEN_WIDTH//2 - 140, 420, 36, RETRO_YELLOW, True)
-        
         # Debug: Show current selection
         debug_text = f"Selected: {self.selected_option}"
         RetroFont.render_retro_text(screen, debug_text, SCREEN_WIDTH//2 - 100, 450, 24, RETRO_GREEN, True)
         
-        # Menu options with retro styling - simplified for better functionality
-        start_y = 490  # Moved down to accommodate debug text
+        # Selection highlight - labels themselves are already in the background
         for i, option in enumerate(self.options):
-            y_pos = start_y + i * 60
+            y_pos = self.OPTIONS_START_Y + i * 60
             is_selected = (i == self.selected_option)
             
             # Special handling for paused state - make "Resting on Tyres" non-selectable
@@ -825,9 +1988,9 @@ class Menu:
             
             # Retro selection box - always draw for selected option
             if is_selected:
-                select_rect = pygame.Rect(SCREEN_WIDTH//2 - 280, y_pos - 8, 560, 50)
+                select_rect = ASSETS.scaled(pygame.Rect(SCREEN_WIDTH//2 - 280, y_pos - 8, 560, 50))
                 pygame.draw.rect(screen, RETRO_YELLOW, select_rect)
-                pygame.draw.rect(screen, RETRO_BLACK, select_rect, 3)
+                pygame.draw.rect(screen, RETRO_BLACK, select_rect, ASSETS.line_width(3))
                 
                 # Retro arrow for selected option
                 arrow_points = [
@@ -835,25 +1998,21 @@ class Menu:
                     (SCREEN_WIDTH//2 - 240, y_pos + 22),
                     (SCREEN_WIDTH//2 - 260, y_pos + 32)
                 ]
-                pygame.draw.polygon(screen, RETRO_BLACK, arrow_points)
-            
-            # Option text with proper colors
-            if self.is_paused and i == 1:  # "Resting on Tyres" - grayed out
-                color = (100, 100, 100)
-            elif is_selected:
-                color = RETRO_BLACK  # Selected text is black on yellow background
-            else:
-                color = RETRO_WHITE  # Normal text is white
-            
-            RetroFont.render_retro_text(screen, option["text"], SCREEN_WIDTH//2 - 220, y_pos, 38, color, True)
-        
-        # Retro instructions
-        inst_bg = pygame.Rect(SCREEN_WIDTH//2 - 250, SCREEN_HEIGHT - 100, 500, 60)
-        pygame.draw.rect(screen, RETRO_BLACK, inst_bg)
-        pygame.draw.rect(screen, RETRO_GREEN, inst_bg, 3)
-        
-        RetroFont.render_retro_text(screen, "↑↓ NAVIGATE    ENTER SELECT", SCREEN_WIDTH//2 - 200, SCREEN_HEIGHT - 85, 24, RETRO_GREEN, True)
-        RetroFont.render_retro_text(screen, "ESC RETURN TO MENU", SCREEN_WIDTH//2 - 120, SCREEN_HEIGHT - 60, 20, RETRO_WHITE, False)
+                pygame.draw.polygon(screen, RETRO_BLACK, ASSETS.scaled(arrow_points))
+                
+                # Selected text is black on yellow background
+                RetroFont.render_retro_text(screen, option["text"], SCREEN_WIDTH//2 - 220, y_pos, 38, RETRO_BLACK, True)
+    
+    def dirty_rects(self):
+        """Screen regions that may have changed since the previous frame"""
+        # Bobbing title box (with the bird wings under it) always moves
+        rects = [pygame.Rect(SCREEN_WIDTH//2 - 350, 10, 700, 140)]
+        # Menu box only when the selection or the labels changed
+        options_state = (self.selected_option, self.is_paused)
+        if options_state != self.last_presented_options:
+            rects.append(pygame.Rect(SCREEN_WIDTH//2 - 300, 400, 600, 280))
+            self.last_presented_options = options_state
+        return rects
     
     def draw_retro_tree(self, screen, x, y, size):
         """Draw retro chunky tree"""
@@ -901,12 +2060,18 @@ class Menu:
     
     def draw_retro_bird_silhouette(self, screen, x, y):
         """Draw retro bird silhouette"""
-        # Body
+        self.draw_retro_bird_body(screen, x, y)
+        self.draw_retro_bird_wing(screen, x, y)
+    
+    def draw_retro_bird_body(self, screen, x, y):
+        """Draw the static body of the retro bird silhouette"""
         pygame.draw.ellipse(screen, (50, 50, 50), (x - 8, y - 5, 16, 10))
         pygame.draw.ellipse(screen, RETRO_BLACK, (x - 8, y - 5, 16, 10), 2)
-        # Wing
+    
+    def draw_retro_bird_wing(self, screen, x, y):
+        """Draw the flapping wing of the retro bird silhouette"""
         wing_flap = math.sin(self.title_animation * 2) * 3
-        pygame.draw.ellipse(screen, (50, 50, 50), (x - 5, y - 8 + wing_flap, 12, 6))
+        pygame.draw.ellipse(screen, (50, 50, 50), ASSETS.scaled((x - 5, y - 8 + wing_flap, 12, 6)))
     
     def draw_detailed_retro_jeep(self, screen, x, y):
         """Draw large detailed retro jeep for menu"""
@@ -966,43 +2131,391 @@ class Menu:
             star_points.append((inner_x, inner_y))
         pygame.draw.polygon(screen, RETRO_WHITE, star_points)
         pygame.draw.polygon(screen, RETRO_BLACK, star_points, 3)
-class Game:
+
+class HudWidget:
+    """HUD label that keeps its last value and only re-renders when it changes"""
+    def __init__(self, template, x, y, size=28, color=RETRO_WHITE, shadow=True):
+        self.template = template
+        self.x = x
+        self.y = y
+        self.size = size
+        self.color = color
+        self.shadow = shadow
+        self.value = None
+        self.surfaces = None
+    
+    def update(self, value=None):
+        """Store a new value; returns True if the label had to be re-rendered"""
+        if self.surfaces is not None and value == self.value:
+            return False
+        self.value = value
+        text = self.template if value is None else self.template.format(value)
+        self.surfaces = RetroFont.get_text_surfaces(text, self.size, self.color, self.shadow)
+        return True
+    
+    def draw(self, screen):
+        RetroFont.blit_text(screen, self.surfaces, self.x, self.y)
+
+class Hud:
+    """Retained-mode HUD - widgets and bars are re-rendered only when their values change"""
+    BAR_WIDTH = 250
+    BAR_HEIGHT = 25
+    BARS_POS = (25, 25)
+    FUEL_BAR_OFFSET = 70  # Fuel bar sits below the health bar
+    PAUSE_RECT = pygame.Rect(SCREEN_WIDTH - 220, 95, 200, 35)
+    COLORKEY = (255, 0, 255)
+    
+    def __init__(self):
+        self.health = HudWidget("HEALTH: {}", 25, 60)
+        self.fuel = HudWidget("FUEL: {}", 25, 130)
+        self.distance = HudWidget("DISTANCE: {}m", SCREEN_WIDTH - 350, 25)
+        self.speed = HudWidget("SPEED: {} mph", SCREEN_WIDTH - 280, 60)
+        self.pause_hint = HudWidget("Press P to Pause", SCREEN_WIDTH - 210, 105, 24, RETRO_YELLOW)
+        self.controls = HudWidget("↑Jump  →Accelerate  ←Reverse  ↓Fast Drop",
+                                  25, SCREEN_HEIGHT - 40, 24, RETRO_YELLOW)
+        self.widgets = [self.health, self.fuel, self.distance, self.speed, self.pause_hint, self.controls]
+        
+        # Both bars live on one cached surface keyed by their fill widths in pixels
+        self.bars = None
+        self.bars_key = None
+        
+        # Re-render counters
+        self.rerendered = 0  # Widgets (bars included) re-rendered in the last frame
+        self.total_rerendered = 0
+        self.frames = 0
+    
+    def render_bars(self, health_fill, fuel_fill):
+        """Draw the health and fuel bars onto the cached bar surface (at the render target's scale)"""
+        w = self.BAR_WIDTH + 6
+        h = self.BAR_HEIGHT + 6
+        scaled = ASSETS.scaled
+        if self.bars is None:
+            self.bars = ASSETS.create(scaled((w, self.FUEL_BAR_OFFSET + h)), self.COLORKEY)
+        self.bars.fill(self.COLORKEY)
+        for top, fill, color in ((0, health_fill, RETRO_RED), (self.FUEL_BAR_OFFSET, fuel_fill, RETRO_BLUE)):
+            pygame.draw.rect(self.bars, RETRO_BLACK, scaled((0, top, w, h)))
+            pygame.draw.rect(self.bars, color, scaled((3, top + 3, fill, self.BAR_HEIGHT)))
+            pygame.draw.rect(self.bars, RETRO_WHITE, scaled((0, top, w, h)), ASSETS.line_width(3))
+    
+    def update(self, jeep, finish_x):
+        """Refresh widgets from the game state; returns how many were re-rendered"""
+        rerendered = 0
+        # Fill widths are truncated to whole pixels exactly as pygame.Rect would
+        bars_key = (int(jeep.health / 100 * self.BAR_WIDTH), int(jeep.fuel / 100 * self.BAR_WIDTH))
+        if bars_key != self.bars_key:
+            self.render_bars(*bars_key)
+            self.bars_key = bars_key
+            rerendered += 1
+        
+        distance = max(0, finish_x - jeep.x)
+        rerendered += self.health.update(int(jeep.health))
+        rerendered += self.fuel.update(int(jeep.fuel))
+        rerendered += self.distance.update(int(distance))
+        rerendered += self.speed.update(int(abs(jeep.velocity_x) * 12))
+        rerendered += self.pause_hint.update()
+        rerendered += self.controls.update()
+        
+        self.rerendered = rerendered
+        self.total_rerendered += rerendered
+        self.frames += 1
+        return rerendered
+    
+    def draw(self, screen, jeep, finish_x):
+        self.update(jeep, finish_x)
+        screen.blit(self.bars, ASSETS.scaled(self.BARS_POS))
+        pause_rect = ASSETS.scaled(self.PAUSE_RECT)
+        pygame.draw.rect(screen, RETRO_BLACK, pause_rect)
+        pygame.draw.rect(screen, RETRO_YELLOW, pause_rect, ASSETS.line_width(2))
+        for widget in self.widgets:
+            widget.draw(screen)
+    
+    def invalidate(self):
+        """Forget every rendered widget and the bar surface"""
+        self.bars = None
+        self.bars_key = None
+        for widget in self.widgets:
+            widget.surfaces = None
+    
+    def memory_size(self):
+        """Bytes held by the bar surface (widget text lives in the RetroFont cache)"""
+        return AssetManager.surface_bytes(self.bars)
+    
+    def stats(self):
+        """Return re-render counters for the last frame and overall"""
+        return {
+            "rerendered": self.rerendered,
+            "total_rerendered": self.total_rerendered,
+            "frames": self.frames,
+            "widgets": len(self.widgets) + 1,
+        }
+
+class DirtyRectTracker:
+    """Collects changed screen regions and pushes only those to the display"""
+    def __init__(self, screen_rect, enabled=False):
+        self.screen_rect = pygame.Rect(screen_rect)
+        self.enabled = enabled
+        self.grid = 1  # Rects are widened to whole blocks when the frame is pixel-scaled
+        self.rects = []
+        self.full = True
+        self.pixels_pushed = 0  # Pixels sent to the display for the last frame
+        self.total_pixels = 0
+        self.frames = 0
+    
+    def mark(self, rect):
+        """Flag a region as changed this frame"""
+        rect = pygame.Rect(rect)
+        if self.grid > 1:
+            left = rect.left // self.grid * self.grid
+            top = rect.top // self.grid * self.grid
+            right = -(-rect.right // self.grid) * self.grid
+            bottom = -(-rect.bottom // self.grid) * self.grid
+            rect = pygame.Rect(left, top, right - left, bottom - top)
+        rect = rect.clip(self.screen_rect)
+        if rect.width and rect.height:
+            self.rects.append(rect)
+    
+    def mark_full(self):
+        """Flag the whole screen as changed this frame"""
+        self.full = True
+    
+    def present(self, display=True):
+        """Update the display and reset for the next frame (display=False only counts the pixels)"""
+        if self.full or not self.enabled:
+            if display:
+                pygame.display.flip()
+            self.pixels_pushed = self.screen_rect.width * self.screen_rect.height
+        else:
+            if self.rects and display:
+                pygame.display.update(self.rects)
+            self.pixels_pushed = sum(rect.width * rect.height for rect in self.rects)
+        self.total_pixels += self.pixels_pushed
+        self.frames += 1
+        self.discard()
+    
+    def discard(self):
+        """Forget this frame's regions without touching the display"""
+        self.rects = []
+        self.full = False
+    
+    def stats(self):
+        """Return pixel counters, including the average against full flips"""
+        full_frame = self.screen_rect.width * self.screen_rect.height
+        average = self.total_pixels / self.frames if self.frames else 0
+        return {
+            "frames": self.frames,
+            "pixels_pushed": self.pixels_pushed,
+            "average_pixels": average,
+            "average_fraction": average / full_frame if full_frame else 0,
+        }
+
+class DetailController:
+    """Lowers optional detail when recent frames overrun the FPS budget and restores it when there is headroom"""
+    LEVELS = [
+        {"name": "HIGH", "animal_animation": True, "scenery_step": 1, "parallax_depth": 3,
+         "grass": True, "tread_dots": True, "obstacle_texture": True},
+        {"name": "MEDIUM", "animal_animation": False, "scenery_step": 2, "parallax_depth": 3,
+         "grass": True, "tread_dots": True, "obstacle_texture": True},
+        {"name": "LOW", "animal_animation": False, "scenery_step": 2, "parallax_depth": 2,
+         "grass": False, "tread_dots": False, "obstacle_texture": True},
+        {"name": "MINIMAL", "animal_animation": False, "scenery_step": 4, "parallax_depth": 1,
+         "grass": False, "tread_dots": False, "obstacle_texture": False},
+    ]
+    WINDOW = 60  # Frames averaged before deciding
+    DEGRADE_AT = 0.9  # Fraction of the budget that counts as overrunning
+    RESTORE_AT = 0.5  # Fraction of the budget that counts as headroom
+    RESTORE_HOLD = 180  # Frames of headroom needed before stepping back up
+    
+    def __init__(self, fps=FPS, level=0, adaptive=True):
+        self.budget_ms = 1000 / fps
+        self.level = level
+        self.adaptive = adaptive
+        self.frame_times = deque(maxlen=self.WINDOW)
+        self.headroom_frames = 0
+        self.changes = 0
+    
+    @property
+    def settings(self):
+        return self.LEVELS[self.level]
+    
+    def average_ms(self):
+        return sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0.0
+    
+    def record(self, frame_ms):
+        """Add a frame's busy time; returns True if the detail level changed"""
+        self.frame_times.append(frame_ms)
+        if not self.adaptive or len(self.frame_times) < self.WINDOW:
+            return False
+        average = self.average_ms()
+        if average > self.budget_ms * self.DEGRADE_AT and self.level < len(self.LEVELS) - 1:
+            return self.set_level(self.level + 1)
+        if average < self.budget_ms * self.RESTORE_AT and self.level > 0:
+            # Hold off until the headroom has lasted a while so levels do not flip-flop
+            self.headroom_frames += 1
+            if self.headroom_frames >= self.RESTORE_HOLD:
+                return self.set_level(self.level - 1)
+        else:
+            self.headroom_frames = 0
+        return False
+    
+    def set_level(self, level):
+        """Jump to a level and start measuring afresh"""
+        level = max(0, min(level, len(self.LEVELS) - 1))
+        if level == self.level:
+            return False
+        self.level = level
+        self.frame_times.clear()
+        self.headroom_frames = 0
+        self.changes += 1
+        return True
+
+class ScriptedKeys:
+    """Stand-in for pygame.key.get_pressed() that drives the game without a keyboard"""
+    JUMP_EVERY = 90  # Frames between jumps
+    TAP_EVERY = 30  # Frames between ENTER/R taps (starts the drive, picks a refuel, restarts)
+    
     def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Jungle Drive - Retro Adventure")
+        self.frame = 0
+        self.pressed = set()
+        self.advance()
+    
+    def advance(self):
+        """Move to the next frame: hold right, tap the other keys on a fixed schedule"""
+        self.frame += 1
+        self.pressed = {pygame.K_RIGHT}
+        if self.frame % self.JUMP_EVERY == 0:
+            self.pressed.add(pygame.K_UP)
+        if self.frame % self.TAP_EVERY == 0:
+            self.pressed.update((pygame.K_RETURN, pygame.K_r))
+    
+    def __getitem__(self, key):
+        return key in self.pressed
+    
+    def __len__(self):
+        return 512
+
+class Game:
+    FUNCTION_KEYS = (pygame.K_F3,)  # Edge-detected keys outside the first 512 key codes
+    SIM_RATE = FPS  # Simulation steps per second; physics constants are tuned for 60
+    MAX_CATCH_UP = 5  # Most simulation steps run for one rendered frame
+    
+    def __init__(self, seed=None, dirty_rects=False, headless=False, detail="auto", render_fps=FPS, herd=0, pixel_scale=1):
+        self.headless = headless
+        if headless:
+            # No window or sound device: SDL's dummy drivers and an offscreen frame
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+        pygame.init()
+        if headless:
+            self.display = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        else:
+            self.display = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption("Jungle Drive - Retro Adventure")
+        ASSETS.init(self.display)
+        self.screen = self.display  # Render target: the window itself, or a low-res frame in pixel mode
         self.clock = pygame.time.Clock()
+        self.render_fps = render_fps  # Frame cap for drawing (0 = uncapped)
+        self.step_time = 1 / self.SIM_RATE
+        self.scripted_keys = ScriptedKeys() if headless else None
+        self.herd = herd  # Stress test: replace the animals with a NumPy herd of this size
+        
+        # Level of detail: "auto" adapts to the frame budget, a level name pins it
+        names = [level["name"].lower() for level in DetailController.LEVELS]
+        self.detail = DetailController(level=names.index(detail) if detail in names else 0,
+                                       adaptive=detail == "auto")
+        self.show_debug = False  # F3 toggles the debug overlay
+        
+        # Display updates (optionally limited to changed regions)
+        self.display_updates = DirtyRectTracker(self.display.get_rect(), enabled=dirty_rects)
+        self.last_presented_mode = None
+        
+        # Dimmed copy of the frozen world shown behind the refuel and game over screens
+        self.overlay_snapshot = None
+        self.snapshot_mode = None
         
         # Game state
         self.state = MENU
         self.menu = Menu()
         self.refuel_menu = RefuelMenu()
+        self.hud = Hud()
+        self.render_queue = RenderQueue()
+        self.set_pixel_scale(pixel_scale)
         
         # Game objects
         self.jeep = None
         self.camera_x = 0
+        self.view_x = 0  # Camera position used for drawing (interpolated between steps)
         self.world_width = 5000
         self.finish_x = self.world_width - 200
+        self.seed = seed  # Fixed seed for generated detail (None picks a new one per world)
+        self.world_seed = None
         
         # Game data
-        self.terrain_height = []
-        self.obstacles = []
-        self.animals = []
+        self.terrain_height = TerrainBuffer()
+        self.terrain_chunks = None
+        self.grass = None
+        self.scenery = None
+        self.parallax = None
+        self.obstacles = ObstacleIndex()
+        self.animals = AnimalGrid()
+        self.finish_flag = None
         
         # Game flags
         self.game_won = False
         self.game_over = False
         self.keys_pressed_last_frame = set()  # Initialize properly
         
+        # Static sky/ground backdrop, rendered once per resolution
+        self.backdrop = None
+        self.build_backdrop()
+        
         self.init_game_world()
+        self.register_assets()
+    
+    def register_assets(self):
+        """Let the asset manager size and rebuild every surface cache the game uses"""
+        def rebuild_parallax():
+            self.parallax = ParallaxBackground.generate(self.world_seed)
+        
+        def drop_overlays():
+            RefuelMenu.overlay = None
+            self.overlay_snapshot = None
+        
+        ASSETS.register_cache("text", lambda: RetroFont._cache_bytes, RetroFont.clear_cache)
+        ASSETS.register_cache("hud", self.hud.memory_size, self.hud.invalidate)
+        ASSETS.register_cache("jeep", Jeep.sprite_memory, Jeep.clear_sprites)
+        ASSETS.register_cache("animals", AnimalAtlas.memory_size, AnimalAtlas.rebuild)
+        ASSETS.register_cache("obstacles", Obstacle.surface_memory, Obstacle.clear_surfaces)
+        ASSETS.register_cache("terrain", lambda: self.terrain_chunks.memory_size(), lambda: self.terrain_chunks.clear())
+        ASSETS.register_cache("parallax", lambda: self.parallax.memory_size(), rebuild_parallax)
+        ASSETS.register_cache("scenery", SceneryIndex.sprite_memory, SceneryIndex.clear_sprites)
+        ASSETS.register_cache("finish_flag", lambda: self.finish_flag.memory_size(), lambda: self.finish_flag.bake())
+        ASSETS.register_cache("menu", lambda: AssetManager.surface_bytes(self.menu.background),
+                              lambda: setattr(self.menu, "background", None))
+        ASSETS.register_cache("backdrop", lambda: AssetManager.surface_bytes(self.backdrop),
+                              lambda: setattr(self, "backdrop", None))
+        ASSETS.register_cache("overlays", lambda: AssetManager.surface_bytes(RefuelMenu.overlay)
+                              + AssetManager.surface_bytes(self.overlay_snapshot), drop_overlays)
     
     def init_game_world(self):
         """Initialize the game world safely"""
         try:
             self.jeep = Jeep(100, SCREEN_HEIGHT - 200)
             self.camera_x = 0
+            self.view_x = 0
+            self.world_seed = self.seed if self.seed is not None else random.randrange(1 << 30)
             self.terrain_height = self.generate_terrain()
+            self.grass = GrassLayer.generate(self.world_width, self.world_seed)
+            self.terrain_chunks = TerrainChunkCache(self.terrain_height, self.grass)
+            self.scenery = SceneryIndex.generate(self.world_width)
+            self.parallax = ParallaxBackground.generate(self.world_seed)
             self.obstacles = self.generate_obstacles()
-            self.animals = self.generate_animals()
+            if self.herd:
+                self.animals = WildlifeHerd.generate(self.herd, self.terrain_height, self.world_seed)
+            else:
+                self.animals = self.generate_animals()
+            self.finish_flag = FinishFlag(self.finish_x, self.terrain_height[self.finish_x] - 120)
+            AnimalAtlas.build()
+            self.apply_detail()
             self.game_won = False
             self.game_over = False
         except Exception as e:
@@ -1010,36 +2523,41 @@ class Game:
             # Fallback initialization
             self.jeep = Jeep(100, SCREEN_HEIGHT - 200)
             self.camera_x = 0
-            self.terrain_height = [SCREEN_HEIGHT - 120] * self.world_width
-            self.obstacles = []
-            self.animals = []
+            self.view_x = 0
+            self.terrain_height = TerrainBuffer([SCREEN_HEIGHT - 120] * self.world_width)
+            self.grass = None
+            self.terrain_chunks = TerrainChunkCache(self.terrain_height)
+            self.scenery = SceneryIndex.generate(self.world_width)
+            self.parallax = ParallaxBackground.generate(self.world_seed)
+            self.obstacles = ObstacleIndex()
+            self.animals = AnimalGrid()
+            self.finish_flag = FinishFlag(self.finish_x, self.terrain_height[self.finish_x] - 120)
             self.game_won = False
             self.game_over = False
     
+    def apply_detail(self):
+        """Push the current detail settings into the caches that depend on them"""
+        settings = self.detail.settings
+        Animal.animate = settings["animal_animation"]
+        Jeep.tread_dots = settings["tread_dots"]  # Part of the sprite cache key
+        
+        grass = self.grass if settings["grass"] else None
+        if self.terrain_chunks is not None and self.terrain_chunks.grass is not grass:
+            self.terrain_chunks.grass = grass
+            self.terrain_chunks.clear()
+        
+        if Obstacle.textured != settings["obstacle_texture"]:
+            Obstacle.textured = settings["obstacle_texture"]
+            Obstacle.clear_surfaces()
+    
     def generate_terrain(self):
-        """Generate retro jungle terrain"""
-        terrain = []
-        base_height = SCREEN_HEIGHT - 120
-        
-        for x in range(self.world_width):
-            # Create hills and valleys with retro chunky feel
-            hill_factor = math.sin(x * 0.008) * 60
-            noise = math.sin(x * 0.05) * 20  # Add some noise
-            
-            # Mountain at the end
-            if x > self.world_width * 0.75:
-                mountain_factor = ((x - self.world_width * 0.75) / (self.world_width * 0.25)) * 250
-                height = base_height - hill_factor - mountain_factor - noise
-            else:
-                height = base_height - hill_factor - noise
-            
-            terrain.append(max(150, height))
-        
-        return terrain
+        """Generate retro jungle terrain (a fixed seed also shifts the hills; no seed keeps the classic track)"""
+        return TerrainBuffer(TerrainGenerator.generate(self.world_width, seed=self.seed))
     
     def generate_obstacles(self):
         """Generate only stones and wood logs as obstacles"""
-        obstacles = []
+        Obstacle.clear_surfaces()  # Let the previous world's obstacles go
+        obstacles = ObstacleIndex()
         
         for i in range(300, self.world_width - 300, 160):  # Better spacing
             if random.random() < 0.5:  # Reduced density for easier gameplay
@@ -1053,13 +2571,13 @@ class Game:
                 x = i + random.randint(-60, 60)
                 y = self.terrain_height[x] - height//2
                 
-                obstacles.append(Obstacle(x, y, width, height, obstacle_type))
+                obstacles.add(Obstacle(x, y, width, height, obstacle_type))
         
         return obstacles
     
     def generate_animals(self):
         """Generate realistic retro jungle animals"""
-        animals = []
+        animals = AnimalGrid()
         animal_types = ["elephant", "tiger", "deer", "bear", "squirrel", "bird"]  # Updated animal list
         
         for i in range(200, self.world_width - 200, 200):  # Better spacing
@@ -1075,150 +2593,133 @@ class Game:
                 else:
                     y = self.terrain_height[x] - random.randint(25, 45)  # Ground animals
                 
-                animals.append(Animal(x, y, animal_type))
+                animals.add(Animal(x, y, animal_type))
         
         return animals
     
     def update_camera(self):
         """Update camera to follow jeep with retro smoothing"""
-        target_x = self.jeep.x - SCREEN_WIDTH // 3
-        self.camera_x = max(0, min(target_x, self.world_width - SCREEN_WIDTH))
+        self.camera_x = self.camera_for(self.jeep.x)
+        self.view_x = self.camera_x
     
-    def draw_terrain(self):
-        """Draw realistic jungle terrain with static background elements"""
-        # Clear and draw realistic sky gradient
-        for y in range(0, SCREEN_HEIGHT//2, 2):
-            sky_intensity = int(135 + (y / (SCREEN_HEIGHT//2)) * 120)
+    def camera_for(self, jeep_x):
+        """Camera position that keeps a jeep at jeep_x in view"""
+        target_x = jeep_x - SCREEN_WIDTH // 3
+        return max(0, min(target_x, self.world_width - SCREEN_WIDTH))
+    
+    def interpolate(self, alpha):
+        """Set drawing positions part way (alpha) from the previous simulation step to the current one"""
+        self.jeep.interpolate(alpha)
+        self.view_x = self.camera_for(self.jeep.render_x)
+    
+    def build_backdrop(self):
+        """Render the sky gradient and base ground into a display-format surface"""
+        width, height = self.screen.get_size()
+        backdrop = ASSETS.create((width, height))
+        
+        # Realistic sky gradient
+        for y in range(0, height//2, 2):
+            sky_intensity = int(135 + (y / (height//2)) * 120)
             sky_color = (135, sky_intensity, 255)
-            pygame.draw.rect(self.screen, sky_color, (0, y, SCREEN_WIDTH, 2))
-        
-        # Fill lower half with base ground color first
-        pygame.draw.rect(self.screen, (34, 100, 34), (0, SCREEN_HEIGHT//2, SCREEN_WIDTH, SCREEN_HEIGHT//2))
-        
-        # Ground with realistic texture
-        ground_points = [(0, SCREEN_HEIGHT)]
+            pygame.draw.rect(backdrop, sky_color, (0, y, width, 2))
         
-        for x in range(int(self.camera_x), min(int(self.camera_x) + SCREEN_WIDTH + 1, len(self.terrain_height))):
-            screen_x = x - self.camera_x
-            ground_points.append((screen_x, self.terrain_height[x]))
+        # Fill lower half with base ground color
+        pygame.draw.rect(backdrop, (34, 100, 34), (0, height//2, width, height - height//2))
         
-        ground_points.append((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.backdrop = backdrop
+        return backdrop
+    
+    def get_backdrop(self):
+        """Return the backdrop, rebuilding it only if the resolution changed"""
+        if self.backdrop is None or self.backdrop.get_size() != self.screen.get_size():
+            self.build_backdrop()
+        return self.backdrop
+    
+    def draw_terrain(self):
+        """Draw the sky, parallax layers and pre-rendered ground (sprites go through the render queue)"""
+        # Pre-rendered sky and base ground in a single blit
+        self.screen.blit(self.get_backdrop(), (0, 0))
         
-        if len(ground_points) > 2:
-            # Main ground color
-            pygame.draw.polygon(self.screen, (34, 100, 34), ground_points)
-            # Ground texture lines
-            pygame.draw.polygon(self.screen, RETRO_BLACK, ground_points, 2)
-            
-            # Add realistic ground details
-            for i in range(len(ground_points) - 2):
-                if i % 3 == 0:  # Every third point
-                    x, y = ground_points[i + 1]
-                    # Small grass tufts
-                    for j in range(3):
-                        grass_x = x + j * 5 - 5
-                        grass_y = y - random.randint(5, 15)
-                        pygame.draw.line(self.screen, DARK_GREEN, (grass_x, y), (grass_x, grass_y), 2)
+        # Mountains, canopy and foliage scrolling at their own depths
+        self.parallax.draw(self.screen, self.view_x, self.detail.settings["parallax_depth"])
         
+        # Ground and grass from pre-rendered terrain chunks
+        self.terrain_chunks.draw(self.screen, self.view_x)
+    
+    def submit_scenery(self, queue):
+        """Queue the static trees and bushes near the camera window"""
         # Static jungle background elements (NO ROTATION/LOOPS)
-        # Pre-calculated positions to avoid random generation in draw loop
-        background_positions = []
-        for i in range(0, self.world_width, 200):  # Fixed spacing
-            background_positions.append({
-                'x': i,
-                'type': 'tree' if (i // 200) % 3 == 0 else 'bush',
-                'size': 35 + ((i // 100) % 3) * 10  # Deterministic size based on position
-            })
-        
-        # Draw only visible background elements
-        for bg_element in background_positions:
-            if int(self.camera_x) - 100 <= bg_element['x'] <= int(self.camera_x) + SCREEN_WIDTH + 100:
-                screen_x = bg_element['x'] - self.camera_x
-                
-                if bg_element['type'] == 'tree':
-                    # Background tree (static)
-                    tree_y = self.terrain_height[bg_element['x']] - 80
-                    tree_size = bg_element['size']
-                    # Tree trunk
-                    pygame.draw.rect(self.screen, RETRO_BROWN, 
-                                   (screen_x - 8, tree_y + tree_size, 16, 40))
-                    # Tree canopy (static circles)
-                    pygame.draw.circle(self.screen, DARK_GREEN, 
-                                     (int(screen_x), int(tree_y)), tree_size)
-                    pygame.draw.circle(self.screen, (0, 80, 0), 
-                                     (int(screen_x), int(tree_y)), tree_size - 10)
-                    
-                else:  # bush
-                    # Background bushes (static)
-                    bush_y = self.terrain_height[bg_element['x']] - 30
-                    bush_size = bg_element['size'] // 2
-                    pygame.draw.ellipse(self.screen, JUNGLE_GREEN, 
-                                      (screen_x - bush_size, bush_y - bush_size//2, 
-                                       bush_size * 2, bush_size))
-                    pygame.draw.ellipse(self.screen, RETRO_BLACK, 
-                                      (screen_x - bush_size, bush_y - bush_size//2, 
-                                       bush_size * 2, bush_size), 2)
-    
-    def draw_finish_line(self):
-        """Draw retro finish flag"""
-        flag_x = self.finish_x - self.camera_x
-        if -100 < flag_x < SCREEN_WIDTH + 100:
-            flag_y = self.terrain_height[self.finish_x] - 120
-            
-            # Flag pole (retro thick)
-            pygame.draw.line(self.screen, RETRO_BROWN, (flag_x, flag_y), (flag_x, flag_y + 100), 8)
-            
-            # Flag (retro checkered)
-            flag_width, flag_height = 80, 40
-            for row in range(4):
-                for col in range(8):
-                    color = RETRO_WHITE if (row + col) % 2 == 0 else RETRO_BLACK
-                    rect = pygame.Rect(flag_x + col * 10, flag_y + row * 10, 10, 10)
-                    pygame.draw.rect(self.screen, color, rect)
-            
-            pygame.draw.rect(self.screen, RETRO_BLACK, (flag_x, flag_y, flag_width, flag_height), 3)
-            
-            # "FINISH" text (retro style)
-            RetroFont.render_retro_text(self.screen, "FINISH", flag_x - 30, flag_y - 40, 32, RETRO_YELLOW)
+        # Only the scenery around the camera window is looked up
+        first, last = self.scenery.query(int(self.view_x) - 100, int(self.view_x) + SCREEN_WIDTH + 100)
+        step = self.detail.settings["scenery_step"]
+        # Thinning keeps every step-th element of the whole world so nothing pops while scrolling
+        for i in range(first + (-first) % step, last, step):
+            element_x = self.scenery.xs[i]
+            kind = self.scenery.kinds[i]
+            # Trees are anchored at their canopy centre, bushes at their middle
+            anchor_y = self.terrain_height[element_x] - (80 if kind == SceneryIndex.TREE else 30)
+            surface, dx, dy = SceneryIndex.get_sprite(kind, self.scenery.sizes[i])
+            queue.submit(RenderQueue.SCENERY, surface, element_x + dx, int(anchor_y) + dy)
+    
+    def render_world(self, include_hud=True):
+        """Draw the game world (and optionally the HUD) to the screen"""
+        self.draw_terrain()
+        
+        # Sprites are culled against the view once and drawn back to front by layer
+        queue = self.render_queue
+        queue.begin(self.view_x)
+        self.submit_scenery(queue)
+        self.animals.submit(queue, int(self.view_x) - 200, int(self.view_x) + SCREEN_WIDTH + 200)
+        for obstacle in self.obstacles.query(int(self.view_x), int(self.view_x) + SCREEN_WIDTH):
+            obstacle.submit(queue)
+        self.finish_flag.submit(queue)
+        self.jeep.submit(queue)
+        queue.flush(self.screen)
+        
+        if include_hud:
+            self.draw_hud()
+    
+    def get_overlay_mode(self):
+        """Return which overlay freezes the world this frame, or None during play and menus"""
+        if self.state == REFUEL_MENU:
+            return REFUEL_MENU
+        if self.state == PLAYING and (self.game_over or self.game_won):
+            return GAME_OVER
+        return None
+    
+    def get_overlay_snapshot(self, overlay_mode):
+        """Return the dimmed world snapshot for an overlay, capturing it when the overlay opens"""
+        if overlay_mode != self.snapshot_mode:
+            self.overlay_snapshot = None
+            self.snapshot_mode = overlay_mode
+        if self.overlay_snapshot is None:
+            # The world does not move while an overlay is open, so render and dim it once
+            self.screen.fill((0, 0, 0))
+            self.render_world(include_hud=overlay_mode == GAME_OVER)
+            self.screen.blit(RefuelMenu.get_overlay(), (0, 0))
+            self.overlay_snapshot = self.screen.copy()
+        return self.overlay_snapshot
     
     def draw_hud(self):
         """Draw retro HUD with pause instruction"""
-        # Health bar (retro style)
-        health_width = 250
-        health_height = 25
-        health_fill = (self.jeep.health / 100) * health_width
-        
-        # Health bar background
-        pygame.draw.rect(self.screen, RETRO_BLACK, (25, 25, health_width + 6, health_height + 6))
-        pygame.draw.rect(self.screen, RETRO_RED, (28, 28, health_fill, health_height))
-        pygame.draw.rect(self.screen, RETRO_WHITE, (25, 25, health_width + 6, health_height + 6), 3)
-        
-        RetroFont.render_retro_text(self.screen, f"HEALTH: {int(self.jeep.health)}", 25, 60, 28, RETRO_WHITE)
-        
-        # Fuel bar (retro style)
-        fuel_fill = (self.jeep.fuel / 100) * health_width
-        pygame.draw.rect(self.screen, RETRO_BLACK, (25, 95, health_width + 6, health_height + 6))
-        pygame.draw.rect(self.screen, RETRO_BLUE, (28, 98, fuel_fill, health_height))
-        pygame.draw.rect(self.screen, RETRO_WHITE, (25, 95, health_width + 6, health_height + 6), 3)
-        
-        RetroFont.render_retro_text(self.screen, f"FUEL: {int(self.jeep.fuel)}", 25, 130, 28, RETRO_WHITE)
-        
-        # Distance and speed (retro style)
-        distance = max(0, self.finish_x - self.jeep.x)
-        RetroFont.render_retro_text(self.screen, f"DISTANCE: {int(distance)}m", SCREEN_WIDTH - 350, 25, 28, RETRO_WHITE)
-        
-        current_speed = abs(self.jeep.velocity_x)
-        RetroFont.render_retro_text(self.screen, f"SPEED: {int(current_speed * 12)} mph", SCREEN_WIDTH - 280, 60, 28, RETRO_WHITE)
-        
-        # Pause instruction (top right corner) - more prominent
-        pause_bg = pygame.Rect(SCREEN_WIDTH - 220, 95, 200, 35)
-        pygame.draw.rect(self.screen, RETRO_BLACK, pause_bg)
-        pygame.draw.rect(self.screen, RETRO_YELLOW, pause_bg, 2)
-        RetroFont.render_retro_text(self.screen, "Press P to Pause", SCREEN_WIDTH - 210, 105, 24, RETRO_YELLOW)
-        
-        # Controls (retro style)
-        RetroFont.render_retro_text(self.screen, "↑Jump  →Accelerate  ←Reverse  ↓Fast Drop", 
-                                   25, SCREEN_HEIGHT - 40, 24, RETRO_YELLOW)
+        self.hud.draw(self.screen, self.jeep, self.finish_x)
+    
+    def draw_debug_overlay(self):
+        """Show the detail level and frame timing (F3)"""
+        detail = self.detail
+        mode = "AUTO" if detail.adaptive else "FIXED"
+        RetroFont.render_retro_text(self.screen, f"LOD {detail.settings['name']} ({mode})",
+                                    SCREEN_WIDTH//2 - 120, 25, 24, RETRO_WHITE)
+        RetroFont.render_retro_text(self.screen, f"{detail.average_ms():.1f} / {detail.budget_ms:.1f} ms",
+                                    SCREEN_WIDTH//2 - 120, 50, 24, RETRO_WHITE)
+        queue = self.render_queue.stats()
+        RetroFont.render_retro_text(self.screen, f"SPRITES {queue['drawn']}/{queue['submitted']} ({queue['culled']} culled)",
+                                    SCREEN_WIDTH//2 - 120, 75, 24, RETRO_WHITE)
+        animals = self.animals.stats()
+        RetroFont.render_retro_text(self.screen, f"ANIMALS {animals['active']} ACTIVE {animals['sleeping']} SLEEPING",
+                                    SCREEN_WIDTH//2 - 120, 100, 24, RETRO_WHITE)
+        RetroFont.render_retro_text(self.screen, f"TERRAIN {self.terrain_height.memory_size() // 1024} KB",
+                                    SCREEN_WIDTH//2 - 120, 125, 24, RETRO_WHITE)
     
     def check_win_condition(self):
         """Check if player reached finish"""
@@ -1233,13 +2734,11 @@ class Game:
             # Instead of game over, show refuel menu
             self.state = REFUEL_MENU
     
-    def draw_game_over_screen(self):
+    def draw_game_over_screen(self, draw_overlay=True):
         """Draw retro game over screen"""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill(RETRO_BLACK)
-        self.screen.blit(overlay, (0, 0))
+        # Semi-transparent overlay (skipped when drawing over an already dimmed snapshot)
+        if draw_overlay:
+            self.screen.blit(RefuelMenu.get_overlay(), (0, 0))
         
         if self.game_won:
             RetroFont.render_retro_text(self.screen, "MISSION COMPLETE!", SCREEN_WIDTH//2 - 250, SCREEN_HEIGHT//2 - 100, 72, RETRO_YELLOW)
@@ -1253,18 +2752,24 @@ class Game:
         
         RetroFont.render_retro_text(self.screen, "Press R to Restart or ESC for Menu", SCREEN_WIDTH//2 - 250, SCREEN_HEIGHT//2 + 60, 32, RETRO_YELLOW)
     
+    def get_keys(self):
+        """Return the keys held this frame (scripted when running headless)"""
+        if self.scripted_keys is not None:
+            return self.scripted_keys
+        return pygame.key.get_pressed()
+    
     def handle_input(self):
         """Handle input based on game state with proper key detection"""
-        keys_pressed = pygame.key.get_pressed()
-        keys_just_pressed = set()
+        keys_pressed = self.get_keys()
         
         # Detect keys just pressed (not held) - this is crucial for menu navigation
-        for key in range(512):  # Check all possible keys
-            if key < len(keys_pressed) and keys_pressed[key] and key not in self.keys_pressed_last_frame:
-                keys_just_pressed.add(key)
+        # Function keys have codes far above 512, so they are checked on their own
+        watched = [key for key in range(512) if key < len(keys_pressed)] + list(self.FUNCTION_KEYS)
+        held = {key for key in watched if keys_pressed[key]}
+        keys_just_pressed = held - self.keys_pressed_last_frame
         
         # Update last frame keys
-        self.keys_pressed_last_frame = {key for key in range(512) if key < len(keys_pressed) and keys_pressed[key]}
+        self.keys_pressed_last_frame = held
         
         if self.state == MENU:
             # Handle menu navigation directly here for better control
@@ -1289,6 +2794,8 @@ class Game:
                         self.menu.set_pause_mode(True)
                 elif selected == 2:  # Park Out of Jungle (Quit)
                     return False
+            elif pygame.K_x in keys_just_pressed:  # Cycle retro pixel mode
+                self.cycle_pixel_scale()
         
         elif self.state == PLAYING:
             if pygame.K_p in keys_just_pressed:  # Pause with P key
@@ -1297,6 +2804,8 @@ class Game:
             elif pygame.K_ESCAPE in keys_just_pressed:
                 self.menu.set_pause_mode(False)
                 self.state = MENU
+            elif pygame.K_F3 in keys_just_pressed:
+                self.show_debug = not self.show_debug
             elif self.game_over or self.game_won:
                 if pygame.K_r in keys_just_pressed:
                     self.init_game_world()
@@ -1316,11 +2825,77 @@ class Game:
         
         return True
     
-    def run(self):
-        """Main game loop"""
+    def set_pixel_scale(self, scale):
+        """Draw at 1/scale resolution and upscale each frame (1 draws straight to the window)"""
+        ASSETS.set_pixel_scale(scale)  # Rebuilds every cache at the new size
+        if scale > 1:
+            self.screen = ASSETS.create(ASSETS.scaled(self.display.get_size()))
+        else:
+            self.screen = self.display
+        self.display_updates.grid = scale
+        self.menu.background = None  # Shows the current mode
+        self.overlay_snapshot = None
+        self.last_presented_mode = None  # Push the whole next frame
+    
+    def cycle_pixel_scale(self):
+        """Step to the next retro pixel mode"""
+        scales = AssetManager.PIXEL_SCALES
+        index = scales.index(ASSETS.pixel_scale) if ASSETS.pixel_scale in scales else -1
+        self.set_pixel_scale(scales[(index + 1) % len(scales)])
+    
+    def present(self):
+        """Push the frame to the display - only changed regions on static screens"""
+        if self.screen is not self.display:
+            # Pixel mode: one nearest-neighbour upscale of the low-res frame into the window
+            pygame.transform.scale(self.screen, self.display.get_size(), self.display)
+        tracker = self.display_updates
+        screen_mode = (self.state, self.game_over or self.game_won)
+        if screen_mode != self.last_presented_mode:
+            # Switching screens changes everything
+            tracker.mark_full()
+        elif self.state == MENU:
+            for rect in self.menu.dirty_rects():
+                tracker.mark(rect)
+        elif self.state == REFUEL_MENU:
+            for rect in self.refuel_menu.dirty_rects():
+                tracker.mark(rect)
+        elif not (self.game_over or self.game_won):
+            # Gameplay scrolls the whole world
+            tracker.mark_full()
+        # The game over screen is static once shown, so nothing else to mark
+        self.last_presented_mode = screen_mode
+        # Headless frames have no window to push to, but still count towards the pixel stats
+        tracker.present(display=not self.headless)
+    
+    def step(self):
+        """Advance the game by one fixed simulation step"""
+        if self.state == MENU:
+            self.menu.update()
+        elif self.state == REFUEL_MENU:
+            self.refuel_menu.update()
+        elif self.state == PLAYING and not self.game_over and not self.game_won:
+            keys_pressed = self.get_keys()
+            self.jeep.update(keys_pressed, self.obstacles, self.terrain_height)
+            self.update_camera()
+            
+            # Animals near the camera update every step, far-off ones catch up now and then
+            self.animals.update(self.camera_x)
+            self.finish_flag.update()
+            
+            self.check_win_condition()
+            self.check_game_over()
+    
+    def run(self, max_frames=None):
+        """Main game loop (max_frames stops it after that many frames, e.g. for headless timing)"""
         running = True
+        frames = 0
+        busy_time = 0.0  # CPU seconds spent updating and drawing, excluding the frame cap
+        accumulator = 0.0  # Real time not yet simulated
+        last_frame_start = time.perf_counter() - self.step_time
         
         while running:
+            frame_start = time.perf_counter()
+            cpu_start = time.process_time()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
@@ -1330,71 +2905,96 @@ class Game:
                 running = False
                 continue
             
-            # Update based on state
-            if self.state == MENU:
-                self.menu.update()
-            elif self.state == REFUEL_MENU:
-                self.refuel_menu.update()
-            elif self.state == PLAYING and not self.game_over and not self.game_won:
-                keys_pressed = pygame.key.get_pressed()
-                self.jeep.update(keys_pressed, self.obstacles, self.terrain_height)
-                self.update_camera()
-                
-                # Update animals
-                for animal in self.animals:
-                    animal.update()
-                
-                self.check_win_condition()
-                self.check_game_over()
+            # Fixed-rate simulation: as many steps as real time requires, capped to avoid a spiral
+            if self.headless:
+                elapsed = self.step_time  # Exactly one step per frame keeps headless runs repeatable
+            else:
+                elapsed = frame_start - last_frame_start
+            last_frame_start = frame_start
+            accumulator += elapsed
+            steps = 0
+            while accumulator >= self.step_time and steps < self.MAX_CATCH_UP:
+                self.step()
+                accumulator -= self.step_time
+                steps += 1
+            if steps == self.MAX_CATCH_UP:
+                accumulator = min(accumulator, self.step_time)  # Too far behind: let the game slow down
+            if self.state == PLAYING and not self.game_over and not self.game_won:
+                # Draw between the last two steps so motion stays smooth at any frame rate
+                self.interpolate(accumulator / self.step_time)
             
             # Draw based on state
-            # Clear screen first to prevent rendering artifacts
-            self.screen.fill((0, 0, 0))  # Clear with black
-            
-            if self.state == MENU:
-                self.menu.draw(self.screen)
-            elif self.state == REFUEL_MENU:
-                # Draw game world in background
-                self.draw_terrain()
-                
-                # Draw animals (background)
-                for animal in self.animals:
-                    animal.draw(self.screen, self.camera_x)
-                
-                # Draw obstacles
-                for obstacle in self.obstacles:
-                    obstacle.draw(self.screen, self.camera_x)
-                
-                self.draw_finish_line()
-                self.jeep.draw(self.screen, self.camera_x)
-                
-                # Draw refuel menu on top
-                self.refuel_menu.draw(self.screen, self.jeep.fuel)
+            overlay_mode = self.get_overlay_mode()
+            if overlay_mode is not None:
+                # Frozen world behind an overlay: one blit plus the overlay widgets
+                self.screen.blit(self.get_overlay_snapshot(overlay_mode), (0, 0))
+                if overlay_mode == REFUEL_MENU:
+                    self.refuel_menu.draw(self.screen, self.jeep.fuel, draw_overlay=False)
+                else:
+                    self.draw_game_over_screen(draw_overlay=False)
             else:
-                # Draw game world
-                self.draw_terrain()
-                
-                # Draw animals (background)
-                for animal in self.animals:
-                    animal.draw(self.screen, self.camera_x)
-                
-                # Draw obstacles
-                for obstacle in self.obstacles:
-                    obstacle.draw(self.screen, self.camera_x)
+                self.overlay_snapshot = None
+                self.snapshot_mode = None
                 
-                self.draw_finish_line()
-                self.jeep.draw(self.screen, self.camera_x)
-                self.draw_hud()
+                # Clear screen first to prevent rendering artifacts
+                self.screen.fill((0, 0, 0))  # Clear with black
                 
-                if self.game_over or self.game_won:
-                    self.draw_game_over_screen()
+                if self.state == MENU:
+                    self.menu.draw(self.screen)
+                else:
+                    self.render_world()
+                    if self.show_debug:
+                        self.draw_debug_overlay()
             
-            pygame.display.flip()
-            self.clock.tick(FPS)
+            self.present()
+            frame_time = time.perf_counter() - frame_start  # Wall time: what the frame budget is about
+            busy_time += time.process_time() - cpu_start
+            if self.state == PLAYING and not self.game_over and not self.game_won:
+                if self.detail.record(frame_time * 1000):
+                    self.apply_detail()
+            frames += 1
+            if max_frames is not None and frames >= max_frames:
+                running = False
+            if self.headless:
+                self.scripted_keys.advance()
+            else:
+                self.clock.tick(self.render_fps)
+        
+        if self.headless or max_frames is not None:
+            print(f"{frames} frames, {busy_time * 1000 / max(1, frames):.2f} ms/frame CPU "
+                  f"({frames / busy_time if busy_time else 0:.0f} fps uncapped)")
+        if self.display_updates.enabled:
+            stats = self.display_updates.stats()
+            print(f"Dirty rects: {stats['average_pixels']:.0f} pixels/frame pushed "
+                  f"({stats['average_fraction'] * 100:.1f}% of full flips)")
         
         pygame.quit()
         sys.exit()
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
+    parser = argparse.ArgumentParser(description="Jungle Drive - Retro Adventure")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="only push changed screen regions on menu and overlay screens")
+    parser.add_argument("--wave-flag", action="store_true",
+                        help="animate the finish flag from pre-rendered wave frames")
+    parser.add_argument("--detail", default="auto",
+                        choices=["auto"] + [level["name"].lower() for level in DetailController.LEVELS],
+                        help="level of optional detail; auto lowers it when frames overrun the budget")
+    parser.add_argument("--render-fps", type=int, default=FPS,
+                        help="frame cap for drawing, e.g. 120, 144 or 30 (0 = uncapped); the game always simulates at 60 Hz")
+    parser.add_argument("--headless", action="store_true",
+                        help="run without a window using scripted input, and report CPU time per frame")
+    parser.add_argument("--frames", type=int, default=None,
+                        help="stop after this many frames (defaults to 600 when headless)")
+    parser.add_argument("--herd", type=int, default=0,
+                        help="replace the animals with a vectorized herd of N animals (needs numpy)")
+    parser.add_argument("--pixel-scale", type=int, choices=AssetManager.PIXEL_SCALES, default=1,
+                        help="retro pixel mode: draw at 1/N resolution and upscale (X in the menu toggles it)")
+    args = parser.parse_args()
+    if args.headless and args.frames is None:
+        args.frames = 600
+    
+    FinishFlag.animate = args.wave_flag
+    game = Game(dirty_rects=args.dirty_rects, headless=args.headless,
+                detail=args.detail, render_fps=args.render_fps, herd=args.herd, pixel_scale=args.pixel_scale)
+    game.run(args.frames)
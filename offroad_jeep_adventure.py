@@ -342,128 +342,6 @@ class Animal:
         pygame.draw.circle(screen, WHITE, (int(screen_x - 17), int(self.y - 5)), 4)
 
 class Obstacle:
-
-class Animal:
-    def __init__(self, x, y, animal_type):
-        self.x = x
-        self.y = y
-        self.type = animal_type
-        self.animation_frame = 0
-        self.direction = random.choice([-1, 1])
-        self.speed = random.uniform(0.5, 2.0)
-        
-        if animal_type == "elephant":
-            self.width, self.height = 60, 40
-        elif animal_type == "monkey":
-            self.width, self.height = 25, 30
-        elif animal_type == "tiger":
-            self.width, self.height = 50, 30
-        elif animal_type == "bird":
-            self.width, self.height = 20, 15
-        else:  # deer
-            self.width, self.height = 35, 35
-    
-    def update(self):
-        self.animation_frame += 0.1
-        # Simple movement for some animals
-        if self.type in ["monkey", "bird"]:
-            self.x += self.direction * self.speed
-            if random.randint(0, 200) == 0:  # Change direction occasionally
-                self.direction *= -1
-    
-    def draw(self, screen, camera_x):
-        screen_x = self.x - camera_x
-        if -100 < screen_x < SCREEN_WIDTH + 100:  # Only draw if on screen
-            if self.type == "elephant":
-                self.draw_elephant(screen, screen_x)
-            elif self.type == "monkey":
-                self.draw_monkey(screen, screen_x)
-            elif self.type == "tiger":
-                self.draw_tiger(screen, screen_x)
-            elif self.type == "bird":
-                self.draw_bird(screen, screen_x)
-            else:  # deer
-                self.draw_deer(screen, screen_x)
-    
-    def draw_elephant(self, screen, screen_x):
-        # Body
-        pygame.draw.ellipse(screen, (105, 105, 105), (screen_x - 30, self.y - 20, 60, 40))
-        # Head
-        pygame.draw.circle(screen, (105, 105, 105), (int(screen_x - 35), int(self.y - 10)), 20)
-        # Trunk
-        trunk_points = [(screen_x - 50, self.y - 5), (screen_x - 60, self.y + 5), (screen_x - 55, self.y + 15)]
-        pygame.draw.lines(screen, (105, 105, 105), False, trunk_points, 8)
-        # Legs
-        for leg_x in [screen_x - 20, screen_x - 10, screen_x + 10, screen_x + 20]:
-            pygame.draw.rect(screen, (90, 90, 90), (leg_x - 3, self.y + 15, 6, 15))
-        # Eye
-        pygame.draw.circle(screen, BLACK, (int(screen_x - 40), int(self.y - 15)), 3)
-    
-    def draw_monkey(self, screen, screen_x):
-        # Body
-        pygame.draw.ellipse(screen, (139, 69, 19), (screen_x - 12, self.y - 15, 25, 30))
-        # Head
-        pygame.draw.circle(screen, (160, 82, 45), (int(screen_x), int(self.y - 20)), 12)
-        # Arms (animated)
-        arm_offset = math.sin(self.animation_frame) * 5
-        pygame.draw.line(screen, (139, 69, 19), (screen_x - 8, self.y - 10), (screen_x - 15, self.y - 5 + arm_offset), 4)
-        pygame.draw.line(screen, (139, 69, 19), (screen_x + 8, self.y - 10), (screen_x + 15, self.y - 5 - arm_offset), 4)
-        # Legs
-        pygame.draw.line(screen, (139, 69, 19), (screen_x - 5, self.y + 10), (screen_x - 8, self.y + 20), 4)
-        pygame.draw.line(screen, (139, 69, 19), (screen_x + 5, self.y + 10), (screen_x + 8, self.y + 20), 4)
-        # Face
-        pygame.draw.circle(screen, BLACK, (int(screen_x - 4), int(self.y - 22)), 2)
-        pygame.draw.circle(screen, BLACK, (int(screen_x + 4), int(self.y - 22)), 2)
-        pygame.draw.circle(screen, BLACK, (int(screen_x), int(self.y - 18)), 1)
-    
-    def draw_tiger(self, screen, screen_x):
-        # Body
-        pygame.draw.ellipse(screen, (255, 140, 0), (screen_x - 25, self.y - 15, 50, 30))
-        # Head
-        pygame.draw.circle(screen, (255, 140, 0), (int(screen_x + 20), int(self.y - 10)), 15)
-        # Stripes
-        for stripe_x in [screen_x - 15, screen_x - 5, screen_x + 5, screen_x + 15]:
-            pygame.draw.line(screen, BLACK, (stripe_x, self.y - 12), (stripe_x, self.y + 8), 2)
-        # Legs
-        for leg_x in [screen_x - 15, screen_x - 5, screen_x + 5, screen_x + 15]:
-            pygame.draw.rect(screen, (255, 140, 0), (leg_x - 2, self.y + 10, 4, 12))
-        # Ears
-        pygame.draw.polygon(screen, (255, 140, 0), [(screen_x + 15, self.y - 20), (screen_x + 20, self.y - 25), (screen_x + 25, self.y - 20)])
-        pygame.draw.polygon(screen, (255, 140, 0), [(screen_x + 20, self.y - 20), (screen_x + 25, self.y - 25), (screen_x + 30, self.y - 20)])
-        # Eyes
-        pygame.draw.circle(screen, BLACK, (int(screen_x + 18), int(self.y - 12)), 2)
-        pygame.draw.circle(screen, BLACK, (int(screen_x + 22), int(self.y - 12)), 2)
-    
-    def draw_bird(self, screen, screen_x):
-        # Body
-        pygame.draw.ellipse(screen, (255, 0, 0), (screen_x - 10, self.y - 8, 20, 15))
-        # Wing (animated)
-        wing_flap = math.sin(self.animation_frame * 3) * 8
-        pygame.draw.ellipse(screen, (200, 0, 0), (screen_x - 5, self.y - 12 + wing_flap, 15, 8))
-        # Head
-        pygame.draw.circle(screen, (255, 0, 0), (int(screen_x + 8), int(self.y - 5)), 6)
-        # Beak
-        pygame.draw.polygon(screen, YELLOW, [(screen_x + 12, self.y - 5), (screen_x + 18, self.y - 3), (screen_x + 12, self.y - 1)])
-        # Eye
-        pygame.draw.circle(screen, BLACK, (int(screen_x + 10), int(self.y - 6)), 1)
-    
-    def draw_deer(self, screen, screen_x):
-        # Body
-        pygame.draw.ellipse(screen, (139, 69, 19), (screen_x - 17, self.y - 15, 35, 25))
-        # Head
-        pygame.draw.circle(screen, (160, 82, 45), (int(screen_x + 15), int(self.y - 15)), 10)
-        # Antlers
-        pygame.draw.line(screen, (101, 67, 33), (screen_x + 12, self.y - 22), (screen_x + 8, self.y - 30), 3)
-        pygame.draw.line(screen, (101, 67, 33), (screen_x + 18, self.y - 22), (screen_x + 22, self.y - 30), 3)
-        pygame.draw.line(screen, (101, 67, 33), (screen_x + 10, self.y - 28), (screen_x + 6, self.y - 32), 2)
-        pygame.draw.line(screen, (101, 67, 33), (screen_x + 20, self.y - 28), (screen_x + 24, self.y - 32), 2)
-        # Legs
-        for leg_x in [screen_x - 10, screen_x - 2, screen_x + 6, screen_x + 14]:
-            pygame.draw.rect(screen, (139, 69, 19), (leg_x - 1, self.y + 5, 2, 15))
-        # Eye
-        pygame.draw.circle(screen, BLACK, (int(screen_x + 18), int(self.y - 17)), 2)
-        # Tail
-        pygame.draw.circle(screen, WHITE, (int(screen_x - 17), int(self.y - 5)), 4)
     def __init__(self, x, y, width, height, obstacle_type="rock"):
         self.x = x
         self.y = y
@@ -485,8 +363,48 @@ class Animal:
             elif self.type == "log":
                 pygame.draw.rect(screen, BROWN, (screen_x - self.width//2, self.y - self.height//2, self.width, self.height))
 
+class ParallaxLayer:
+    """Background strip pre-rendered once and scrolled at a fraction of the camera speed"""
+    WIDTH = 1600  # The strip repeats after this many pixels
+    COLORKEY = (255, 0, 255)
+    
+    def __init__(self, height, y, rate):
+        self.surface = pygame.Surface((self.WIDTH, height))
+        self.surface.fill(self.COLORKEY)
+        self.surface.set_colorkey(self.COLORKEY, pygame.RLEACCEL)
+        self.y = y
+        self.rate = rate
+    
+    @classmethod
+    def shapes(cls, rng, step, low, high):
+        """Return (x, size) pairs that repeat seamlessly across the strip edges"""
+        count = cls.WIDTH // step
+        sizes = [rng.randint(low, high) for _ in range(count)]
+        return [(k * step, sizes[k % count]) for k in range(-1, count + 2)]
+    
+    @classmethod
+    def mountains(cls, rng, color, y, rate):
+        layer = cls(180, y, rate)
+        ridge = [(x, 180 - size) for x, size in cls.shapes(rng, 100, 50, 170)]
+        pygame.draw.polygon(layer.surface, color, [(ridge[0][0], 180)] + ridge + [(ridge[-1][0], 180)])
+        return layer
+    
+    @classmethod
+    def treeline(cls, rng, color, y, rate):
+        layer = cls(120, y, rate)
+        for x, radius in cls.shapes(rng, 50, 25, 45):
+            pygame.draw.circle(layer.surface, color, (x, 120 - radius), radius)
+        pygame.draw.rect(layer.surface, color, (0, 80, cls.WIDTH, 40))
+        return layer
+    
+    def draw(self, screen, camera_x):
+        x = -(int(camera_x * self.rate) % self.WIDTH)
+        while x < SCREEN_WIDTH:
+            screen.blit(self.surface, (x, self.y))
+            x += self.WIDTH
+
 class Game:
-    def __init__(self):
+    def __init__(self, seed=None):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Offroad Jeep Adventure")
         self.clock = pygame.time.Clock()
@@ -500,6 +418,13 @@ class Game:
         # Generate terrain
         self.terrain_height = self.generate_terrain()
         
+        # Jungle plants are picked once so they do not flicker between frames
+        self.seed = seed if seed is not None else random.randrange(1 << 30)
+        self.jungle_plants = self.generate_jungle_plants()
+        
+        # Distant mountains, jungle canopy and near foliage
+        self.parallax_layers = self.generate_parallax_layers()
+        
         # Generate obstacles
         self.obstacles = self.generate_obstacles()
         
@@ -510,6 +435,23 @@ class Game:
         self.game_won = False
         self.game_over = False
         
+        # Static backdrop, rendered once per resolution
+        self.backdrop = None
+        self.build_backdrop()
+        
+    def build_backdrop(self):
+        """Render the static backdrop into a display-format surface"""
+        backdrop = pygame.Surface(self.screen.get_size(), 0, self.screen)
+        backdrop.fill(GREEN)  # Sky color
+        self.backdrop = backdrop
+        return backdrop
+    
+    def get_backdrop(self):
+        """Return the backdrop, rebuilding it only if the resolution changed"""
+        if self.backdrop is None or self.backdrop.get_size() != self.screen.get_size():
+            self.build_backdrop()
+        return self.backdrop
+    
     def generate_terrain(self):
         """Generate jungle terrain with hills leading to mountain"""
         terrain = []
@@ -529,6 +471,26 @@ class Game:
         
         return terrain
     
+    def generate_jungle_plants(self):
+        """Generate plant sizes for every 50px slot (0 means no plant)"""
+        rng = random.Random(self.seed)
+        plants = []
+        for x in range(0, self.world_width, 50):
+            if rng.randint(0, 3) == 0:  # Random jungle plants
+                plants.append(rng.randint(10, 25))
+            else:
+                plants.append(0)
+        return plants
+    
+    def generate_parallax_layers(self):
+        """Pre-render the background layers, back to front"""
+        rng = random.Random(f"parallax:{self.seed}")
+        return [
+            ParallaxLayer.mountains(rng, MOUNTAIN_COLOR, 330, 0.1),
+            ParallaxLayer.treeline(rng, (20, 90, 20), 440, 0.3),
+            ParallaxLayer.treeline(rng, (28, 120, 28), 520, 0.6),
+        ]
+    
     def generate_obstacles(self):
         """Generate jungle obstacles"""
         obstacles = []
@@ -578,6 +540,10 @@ class Game:
     
     def draw_terrain(self):
         """Draw jungle terrain"""
+        # Parallax background: a fixed number of blits however long the world is
+        for layer in self.parallax_layers:
+            layer.draw(self.screen, self.camera_x)
+        
         # Draw ground
         ground_points = [(0, SCREEN_HEIGHT)]
         
@@ -593,10 +559,9 @@ class Game:
         # Draw jungle background elements
         for i in range(int(self.camera_x // 50), int((self.camera_x + SCREEN_WIDTH) // 50) + 1):
             x = i * 50
-            if 0 <= x < self.world_width:
+            if 0 <= x < self.world_width and self.jungle_plants[i]:
                 screen_x = x - self.camera_x
-                if random.randint(0, 3) == 0:  # Random jungle plants
-                    pygame.draw.circle(self.screen, DARK_GREEN, (int(screen_x), int(self.terrain_height[x] - 20)), random.randint(10, 25))
+                pygame.draw.circle(self.screen, DARK_GREEN, (int(screen_x), int(self.terrain_height[x] - 20)), self.jungle_plants[i])
     
     def draw_finish_line(self):
         """Draw the finish flag on the mountain"""
@@ -731,7 +696,7 @@ class Game:
                 self.check_game_over()
             
             # Draw everything
-            self.screen.fill(GREEN)  # Sky color
+            self.screen.blit(self.get_backdrop(), (0, 0))
             
             self.draw_terrain()
             
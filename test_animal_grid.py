@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test script for AnimalGrid sleeping updates and the Animal catch-up step
+"""
+
+import pygame
+import random
+import sys
+import os
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    import jungle_drive
+    from jungle_drive import Animal, AnimalGrid
+
+    print("🎮 Testing AnimalGrid...")
+
+    pygame.init()
+    rng = random.Random(22)
+
+    def make_animals():
+        return [Animal(500 + i * 37, 300, animal_type)
+                for i, animal_type in enumerate(["squirrel", "bird", "monkey", "deer"] * 10)]
+
+    # Turning stubbed out: catching up in one go must match single steps
+    real_randint, real_random = jungle_drive.random.randint, jungle_drive.random.random
+    jungle_drive.random.randint = lambda a, b: b
+    jungle_drive.random.random = lambda: 1.0
+    stepped, caught_up = make_animals(), make_animals()
+    for a, b in zip(stepped, caught_up):
+        b.direction, b.speed = a.direction, a.speed
+    for _ in range(240):
+        for animal in stepped:
+            animal.update()
+    for ticks in (1, 7, 8, 64, 160):
+        for animal in caught_up:
+            animal.update(ticks)
+    jungle_drive.random.randint, jungle_drive.random.random = real_randint, real_random
+
+    dx = max(abs(a.x - b.x) for a, b in zip(stepped, caught_up))
+    dy = max(abs(a.y - b.y) for a, b in zip(stepped, caught_up))
+    if dx <= 1e-9 and dy <= 1e-9:
+        print(f"✓ Catch-up matches per-step updates (dx {dx:.1e}, dy {dy:.1e})")
+    else:
+        print(f"❌ Catch-up drifted from per-step updates (dx {dx:.1e}, dy {dy:.1e})")
+
+    # Active and sleeping counts follow the view
+    grid = AnimalGrid([Animal(x, 300, "deer") for x in range(0, 10000, 100)])
+    grid.update(0)
+    near = AnimalGrid.ACTIVE_MARGIN + 1200 + AnimalGrid.BUCKET_WIDTH
+    stats = grid.stats()
+    if stats["active"] + stats["sleeping"] == len(grid) and 0 < stats["active"] <= near // 100 + 1:
+        print(f"✓ {stats['active']} active and {stats['sleeping']} sleeping animals")
+    else:
+        print(f"❌ Unexpected counts: {stats}")
+    grid.update(8000)
+    if grid.stats()["active"] > 0 and grid.stats() != stats:
+        print("✓ Counts follow the camera")
+    else:
+        print("❌ Counts did not change with the camera")
+
+    # Animals walking across bucket boundaries are re-filed and keep their step count
+    walkers = [Animal(AnimalGrid.BUCKET_WIDTH * k - 1, 300, "squirrel") for k in range(1, 30)]
+    for walker in walkers:
+        walker.direction, walker.speed = 1, 1.5
+    grid = AnimalGrid(walkers)
+    for step in range(400):
+        grid.update(rng.choice([0, 3000, 6000]))
+    misplaced = [bucket for bucket, entries in grid.buckets.items()
+                 for animal, _ in entries if grid.bucket_of(animal.x) != bucket]
+    behind = [entry for entries in grid.buckets.values() for entry in entries if grid.step - entry[1] >= AnimalGrid.SLEEP_INTERVAL]
+    if not misplaced and len(grid) == sum(1 for _ in grid) == len(walkers):
+        print("✓ Animals crossing bucket boundaries are moved to their new bucket")
+    else:
+        print(f"❌ {len(misplaced)} animals are filed in the wrong bucket")
+    if not behind:
+        print("✓ Sleeping animals are never more than one sleep interval behind")
+    else:
+        print(f"❌ {len(behind)} animals fell behind")
+
+    print("\n✅ AnimalGrid tests completed!")
+
+    pygame.quit()
+
+except Exception as e:
+    print(f"❌ Error during test: {e}")
+    import traceback
+    traceback.print_exc()
+    pygame.quit()
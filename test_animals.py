@@ -7,7 +7,7 @@ try:
     import pygame
     pygame.init()
     
-    from jungle_drive import Animal
+    from jungle_drive import Animal, AnimalAtlas
     
     # Test creating each animal type
     animal_types = ["elephant", "tiger", "deer", "bear", "squirrel", "bird", "monkey"]
@@ -29,6 +29,14 @@ try:
         except Exception as e:
             print(f"❌ Error creating {animal_type}: {e}")
     
+    # Test the sprite atlas covers every animal type and phase
+    AnimalAtlas.build()
+    missing = [t for t in animal_types if (t, 0) not in AnimalAtlas.cells]
+    if missing:
+        print(f"❌ Atlas missing: {', '.join(missing)}")
+    else:
+        print(f"✓ Atlas has {len(AnimalAtlas.cells)} frames ({AnimalAtlas.memory_size() // 1024} KB)")
+    
     print("\n🎮 Animal tests completed!")
     
 except Exception as e:
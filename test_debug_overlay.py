@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test script for the F3 debug overlay toggle
+"""
+
+import pygame
+import sys
+import os
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    from jungle_drive import Game, PLAYING
+
+    print("🎮 Testing the F3 debug overlay toggle...")
+
+    class HeldKeys:
+        """Stand-in for pygame.key.get_pressed() holding a fixed set of keys"""
+        def __init__(self, *keys):
+            self.pressed = set(keys)
+
+        def __getitem__(self, key):
+            return key in self.pressed
+
+        def __len__(self):
+            return 512
+
+    game = Game(seed=1, headless=True)
+    game.state = PLAYING
+    pygame.key.get_pressed()[pygame.K_F3]  # Function key codes index the real key state too
+    print("✓ Real key state can be read for F3")
+
+    game.scripted_keys = HeldKeys(pygame.K_F3)
+    game.handle_input()
+    if game.show_debug:
+        print("✓ Pressing F3 opens the debug overlay")
+    else:
+        print("❌ Pressing F3 did not open the debug overlay")
+
+    game.handle_input()
+    if game.show_debug:
+        print("✓ Holding F3 does not toggle it again")
+    else:
+        print("❌ Holding F3 toggled the overlay every frame")
+
+    game.scripted_keys = HeldKeys()
+    game.handle_input()
+    game.scripted_keys = HeldKeys(pygame.K_F3)
+    game.handle_input()
+    if not game.show_debug:
+        print("✓ Pressing F3 again closes the debug overlay")
+    else:
+        print("❌ Pressing F3 again did not close the debug overlay")
+
+    # The overlay draws the world stats it reports
+    game.show_debug = True
+    game.render_world()
+    game.draw_debug_overlay()
+    print("✓ Debug overlay drawn")
+
+    print("\n✅ Debug overlay tests completed!")
+
+    pygame.quit()
+
+except Exception as e:
+    print(f"❌ Error during test: {e}")
+    import traceback
+    traceback.print_exc()
+    pygame.quit()
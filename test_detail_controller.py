@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test script for the DetailController frame-time hysteresis
+"""
+
+import random
+import sys
+import os
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    from jungle_drive import DetailController
+
+    print("🎮 Testing DetailController hysteresis...")
+
+    window = DetailController.WINDOW
+    hold = DetailController.RESTORE_HOLD
+    rng = random.Random(18)
+
+    # Overrunning frames step down one level per full window
+    detail = DetailController()
+    changed_at = [frame for frame in range(1000) if detail.record(16.5)]
+    if changed_at == [window - 1, 2 * window - 1, 3 * window - 1] and detail.level == len(DetailController.LEVELS) - 1:
+        print(f"✓ Sustained overruns degrade one level per {window} frames down to {detail.settings['name']}")
+    else:
+        print(f"❌ Unexpected degrade steps at frames {changed_at}")
+
+    # Noisy frames between the two thresholds never change the level
+    detail = DetailController()
+    changes = sum(detail.record(rng.uniform(9.0, 14.5)) for _ in range(5000))
+    if changes == 0:
+        print("✓ Frames inside the dead band never change the level")
+    else:
+        print(f"❌ {changes} level changes inside the dead band")
+
+    # Detail that costs more than the budget at HIGH but fits at MEDIUM settles there
+    cost = {0: 17.0, 1: 12.0, 2: 9.0, 3: 6.0}
+    detail = DetailController()
+    levels = []
+    for _ in range(10000):
+        detail.record(cost[detail.level] + rng.uniform(-1.5, 1.5))
+        levels.append(detail.level)
+    if detail.changes == 1 and levels[-1] == 1:
+        print("✓ Level settles after one step down and does not oscillate")
+    else:
+        print(f"❌ {detail.changes} level changes, ending at level {levels[-1]}")
+
+    # Headroom restores detail only after it has lasted RESTORE_HOLD frames
+    detail = DetailController(level=2)
+    changed_at = [frame for frame in range(2000) if detail.record(4.0)]
+    # Headroom is counted from the first full window (frame WINDOW - 1) onwards
+    first_restore = window - 1 + hold - 1
+    if changed_at == [first_restore, first_restore + window + hold - 1] and detail.level == 0:
+        print(f"✓ Headroom restores a level only after {hold} frames")
+    else:
+        print(f"❌ Unexpected restore steps at frames {changed_at}")
+
+    # A single slow spike after headroom resets the hold
+    detail = DetailController(level=1)
+    for _ in range(window + hold - 10):
+        detail.record(4.0)
+    detail.record(400.0)  # Spike pushes the average above the restore threshold
+    restored = any(detail.record(4.0) for _ in range(window - 1))
+    if not restored and detail.level >= 1:
+        print("✓ A slow spike resets the headroom hold")
+    else:
+        print("❌ Detail was restored despite a recent slow spike")
+
+    # Pinned levels ignore frame times
+    detail = DetailController(level=3, adaptive=False)
+    if not any(detail.record(1.0) for _ in range(1000)) and detail.level == 3:
+        print("✓ A pinned level never changes")
+    else:
+        print("❌ A pinned level changed")
+
+    print("\n✅ DetailController tests completed!")
+
+except Exception as e:
+    print(f"❌ Error during test: {e}")
+    import traceback
+    traceback.print_exc()
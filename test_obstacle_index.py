@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test script for the ObstacleIndex range query and collision lookup
+"""
+
+import pygame
+import random
+import sys
+import os
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    from jungle_drive import Obstacle, ObstacleIndex
+
+    print("🎮 Testing ObstacleIndex...")
+
+    pygame.init()
+    rng = random.Random(21)
+
+    # Mixed widths, with several obstacles sharing the same x
+    obstacles = []
+    for i in range(400):
+        x = rng.randrange(0, 20000) if i % 5 else obstacles[-1].x if obstacles else 100
+        obstacle_type = rng.choice(["rock", "log"])
+        width = rng.randint(45, 80) if obstacle_type == "rock" else rng.randint(80, 140)
+        obstacles.append(Obstacle(x, rng.randint(550, 700), width, rng.randint(30, 55), obstacle_type))
+
+    index = ObstacleIndex(obstacles)
+    if len(index) == len(obstacles) and sorted(index, key=lambda o: o.rect.centerx) == list(index):
+        print(f"✓ Index holds {len(index)} obstacles in x order")
+    else:
+        print("❌ Index lost obstacles or is not sorted by x")
+
+    # Jeep-sized boxes everywhere, plus boxes touching each obstacle at its edges and at the query reach
+    rects = [pygame.Rect(rng.randrange(-200, 20200), rng.randint(500, 720), 100, 50) for _ in range(2000)]
+    for obstacle in obstacles[:100]:
+        for dx in (-100, -99, -1, 0, obstacle.rect.width - 1, obstacle.rect.width,
+                   -index.reach - 100, index.reach + obstacle.rect.width):
+            rects.append(pygame.Rect(obstacle.rect.left + dx, obstacle.rect.top, 100, 50))
+
+    mismatches = 0
+    for rect in rects:
+        expected = [o for o in index if rect.colliderect(o.rect)]
+        if index.colliding(rect) != expected:
+            mismatches += 1
+    if mismatches == 0:
+        print(f"✓ colliding() matches a brute-force colliderect scan for {len(rects)} boxes")
+    else:
+        print(f"❌ colliding() disagreed with the brute-force scan for {mismatches} boxes")
+
+    # Range queries return every obstacle overlapping the span, in x order
+    mismatches = 0
+    for _ in range(500):
+        start = rng.randrange(-300, 20300)
+        end = start + rng.randint(1, 1500)
+        expected = [o for o in index if o.rect.right > start and o.rect.left < end]
+        if index.query(start, end) != expected:
+            mismatches += 1
+    if mismatches == 0:
+        print("✓ query() matches a brute-force overlap scan")
+    else:
+        print(f"❌ query() disagreed with the brute-force scan for {mismatches} spans")
+
+    print("\n✅ ObstacleIndex tests completed!")
+
+    pygame.quit()
+
+except Exception as e:
+    print(f"❌ Error during test: {e}")
+    import traceback
+    traceback.print_exc()
+    pygame.quit()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test script for the retro pixel mode render target and half-size caches
+"""
+
+import pygame
+import sys
+import os
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    import jungle_drive
+    from jungle_drive import ASSETS, AnimalAtlas, Game, SCREEN_WIDTH, SCREEN_HEIGHT
+
+    print("🎮 Testing retro pixel mode...")
+
+    game = Game(seed=3, headless=True)
+    game.state = jungle_drive.PLAYING
+    game.screen.fill((0, 0, 0))
+    game.render_world()
+    full = pygame.image.tostring(game.display, "RGB")
+    atlas_size = AnimalAtlas.surface.get_size()
+
+    # Switching renders into a 600x400 target from half-size caches
+    game.cycle_pixel_scale()
+    if ASSETS.pixel_scale == 2 and game.screen.get_size() == (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2):
+        print(f"✓ Pixel mode draws into a {game.screen.get_width()}x{game.screen.get_height()} target")
+    else:
+        print(f"❌ Unexpected render target {game.screen.get_size()} at scale {ASSETS.pixel_scale}")
+    if AnimalAtlas.surface.get_size() == (atlas_size[0] // 2, atlas_size[1] // 2):
+        print("✓ Caches are rebuilt at half size")
+    else:
+        print(f"❌ Animal atlas is {AnimalAtlas.surface.get_size()}, expected half of {atlas_size}")
+
+    # The low-res frame is upscaled to the whole window in blocks of 2x2 pixels
+    game.screen.fill((0, 0, 0))
+    game.render_world()
+    game.present()
+    pixels = pygame.PixelArray(game.display)
+    blocky = all(pixels[x, y] == pixels[x + 1, y] == pixels[x, y + 1] == pixels[x + 1, y + 1]
+                 for x in range(0, SCREEN_WIDTH, 14) for y in range(0, SCREEN_HEIGHT, 14))
+    del pixels
+    if blocky:
+        print("✓ The frame is upscaled once into chunky 2x2 pixels")
+    else:
+        print("❌ The upscaled frame is not made of 2x2 blocks")
+
+    # Switching back restores the full-resolution frame exactly
+    game.cycle_pixel_scale()
+    game.screen.fill((0, 0, 0))
+    game.render_world()
+    if game.screen is game.display and pygame.image.tostring(game.display, "RGB") == full:
+        print("✓ Switching pixel mode off restores the original frame")
+    else:
+        print("❌ Full-resolution frame changed after a pixel mode round trip")
+
+    print("\n✅ Pixel mode tests completed!")
+
+    pygame.quit()
+
+except Exception as e:
+    print(f"❌ Error during test: {e}")
+    import traceback
+    traceback.print_exc()
+    pygame.quit()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test script for TerrainBuffer storage, height_at and shared memory
+"""
+
+import sys
+import os
+from multiprocessing import Process, Queue
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from jungle_drive import TerrainBuffer, TerrainGenerator, SCREEN_HEIGHT
+
+
+def read_shared(name, length, results):
+    """Attach to the shared heights from a child process and report a few of them"""
+    terrain = TerrainBuffer.attach(name, length)
+    results.put((len(terrain), terrain[0], terrain[length // 2], terrain[length - 1]))
+    terrain.close()
+
+
+if __name__ == "__main__":
+    try:
+        print("🎮 Testing TerrainBuffer...")
+
+        terrain = TerrainBuffer(TerrainGenerator.generate(100000))
+        if len(terrain) == 100000 and terrain.memory_size() == 100000 * 4:
+            print(f"✓ {len(terrain)} columns stored in {terrain.memory_size() // 1024} KB")
+        else:
+            print(f"❌ Unexpected size: {len(terrain)} columns, {terrain.memory_size()} bytes")
+
+        # Outside the world height_at falls back to the default
+        inside = terrain.height_at(500.7) == terrain[500]
+        outside = [terrain.height_at(-1), terrain.height_at(len(terrain)), terrain.height_at(10 ** 9, default=42)]
+        if inside and outside == [SCREEN_HEIGHT - 100, SCREEN_HEIGHT - 100, 42]:
+            print("✓ height_at reads inside the world and falls back outside it")
+        else:
+            print("❌ height_at returned the wrong height")
+
+        # Share with a child process
+        block = terrain.share()
+        results = Queue()
+        child = Process(target=read_shared, args=(block.name, len(terrain), results))
+        child.start()
+        seen = results.get(timeout=30)
+        child.join()
+        expected = (len(terrain), terrain[0], terrain[len(terrain) // 2], terrain[len(terrain) - 1])
+        if seen == expected and child.exitcode == 0:
+            print("✓ A child process reads the same heights through shared memory")
+        else:
+            print(f"❌ Child process saw {seen}, expected {expected}")
+
+        # Attaching in this process works too, and close() releases the block
+        attached = TerrainBuffer.attach(block.name, len(terrain))
+        same = attached[1234] == terrain[1234]
+        attached.close()
+        block.close()
+        block.unlink()
+        if same and attached.shared is None and len(attached) == 0:
+            print("✓ attach() and close() work in the same process")
+        else:
+            print("❌ attach() or close() misbehaved")
+
+        print("\n✅ TerrainBuffer tests completed!")
+
+    except Exception as e:
+        print(f"❌ Error during test: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test script for the RetroFont font registry and text surface cache
+"""
+
+import pygame
+import sys
+import os
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    from jungle_drive import RetroFont, RETRO_YELLOW
+
+    print("🎮 Testing RetroFont text cache...")
+
+    # Initialize pygame
+    pygame.init()
+    screen = pygame.Surface((400, 200))
+    RetroFont.clear_cache()
+
+    # Same label twice should be one miss and one hit
+    RetroFont.render_retro_text(screen, "MISSION CONTROL", 10, 10, 36, RETRO_YELLOW, True)
+    RetroFont.render_retro_text(screen, "MISSION CONTROL", 10, 10, 36, RETRO_YELLOW, True)
+    stats = RetroFont.cache_stats()
+    print(f"✓ After repeated label: {stats['hits']} hit(s), {stats['misses']} miss(es)")
+    if stats["hits"] == 1 and stats["misses"] == 1:
+        print("✓ Repeated label served from cache")
+    else:
+        print("❌ Repeated label was not cached")
+
+    # Fonts are loaded once per size
+    if RetroFont.get_font(36) is RetroFont.get_font(36):
+        print("✓ Font registry reuses loaded fonts")
+    else:
+        print("❌ Font registry loaded the same size twice")
+
+    # Cache stays within its memory budget
+    RetroFont.cache_budget = 64 * 1024
+    for i in range(200):
+        RetroFont.render_retro_text(screen, f"DISTANCE: {i}m", 10, 50, 28)
+    stats = RetroFont.cache_stats()
+    print(f"✓ Cache holds {stats['entries']} entries using {stats['bytes']} bytes")
+    if stats["bytes"] <= stats["budget"]:
+        print("✓ Text cache stays within its memory budget")
+    else:
+        print("❌ Text cache exceeded its memory budget")
+
+    print("\n✅ Text cache tests completed!")
+
+    pygame.quit()
+
+except Exception as e:
+    print(f"❌ Error during test: {e}")
+    import traceback
+    traceback.print_exc()
+    pygame.quit()
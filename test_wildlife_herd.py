@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test script for WildlifeHerd array updates against the per-object Animal.update
+"""
+
+import pygame
+import random
+import sys
+import os
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    import jungle_drive
+    from jungle_drive import Animal, AnimalAtlas, RenderQueue, WildlifeHerd
+
+    print("🎮 Testing WildlifeHerd...")
+
+    pygame.init()
+    rng = random.Random(23)
+
+    def make_animals():
+        return [Animal(500 + i * 37, 300, animal_type)
+                for i, animal_type in enumerate(WildlifeHerd.TYPES * 6)]
+
+    # Turning stubbed out: the herd must move exactly like the Animal objects it was copied from
+    real_randint = jungle_drive.random.randint
+    jungle_drive.random.randint = lambda a, b: b
+    animals = make_animals()
+    herd = WildlifeHerd.from_animals(animals, seed=23)
+    herd.turn_chance[:] = 0
+    for _ in range(240):
+        for animal in animals:
+            animal.update()
+        herd.advance()
+    jungle_drive.random.randint = real_randint
+
+    dx = max(abs(a.x - x) for a, x in zip(animals, herd.x.tolist()))
+    dy = max(abs(a.y - y) for a, y in zip(animals, herd.y.tolist()))
+    frames = max(abs(a.animation_frame - f) for a, f in zip(animals, herd.frame.tolist()))
+    if dx <= 1e-9 and dy <= 1e-9 and frames <= 1e-9:
+        print(f"✓ advance() matches Animal.update (dx {dx:.1e}, dy {dy:.1e})")
+    else:
+        print(f"❌ advance() drifted from Animal.update (dx {dx:.1e}, dy {dy:.1e}, frame {frames:.1e})")
+
+    # advance(ticks) must match ticks single steps
+    stepped = WildlifeHerd.from_animals(make_animals())
+    jumped = WildlifeHerd.from_animals(make_animals())
+    jumped.direction[:], jumped.speed[:] = stepped.direction, stepped.speed
+    stepped.turn_chance[:] = 0
+    jumped.turn_chance[:] = 0
+    for _ in range(240):
+        stepped.advance()
+    for ticks in (1, 7, 8, 64, 160):
+        jumped.advance(ticks)
+    dx = float(abs(stepped.x - jumped.x).max())
+    dy = float(abs(stepped.y - jumped.y).max())
+    if dx <= 1e-9 and dy <= 1e-9:
+        print(f"✓ advance(ticks) matches single steps (dx {dx:.1e}, dy {dy:.1e})")
+    else:
+        print(f"❌ advance(ticks) drifted from single steps (dx {dx:.1e}, dy {dy:.1e})")
+
+    # submit() only queues the animals inside the requested span
+    AnimalAtlas.build()
+    terrain = [600.0] * 20000
+    herd = WildlifeHerd.generate(2000, terrain, seed=23)
+    queue = RenderQueue(view_width=10 ** 6, view_height=10 ** 6)  # Nothing is culled by the view
+    anchor_x, anchor_y = AnimalAtlas.CELL_ANCHOR
+    for _ in range(20):
+        start_x = rng.randrange(-500, 20000)
+        end_x = start_x + rng.randrange(0, 3000)
+        queue.begin(0)
+        herd.submit(queue, start_x, end_x)
+        queued = sorted((x + anchor_x, y + anchor_y) for _, (x, y), _ in queue.layers[RenderQueue.ANIMALS])
+        expected = sorted((x, y) for x, y in zip(herd.x.tolist(), herd.y.tolist()) if start_x <= x <= end_x)
+        if queued != expected or queue.stats()["submitted"] != len(expected):
+            print(f"❌ submit({start_x}, {end_x}) queued {len(queued)} animals, expected {len(expected)}")
+            break
+    else:
+        print("✓ submit() queues exactly the animals inside the span")
+
+    print("\n✅ WildlifeHerd tests completed!")
+
+    pygame.quit()
+
+except Exception as e:
+    print(f"❌ Error during test: {e}")
+    import traceback
+    traceback.print_exc()
+    pygame.quit()